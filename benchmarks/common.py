@@ -0,0 +1,146 @@
+"""
+Synthetic figures for the benchmarks. Everything is drawn with the Agg
+backend, so the benchmarks can be run headless.
+"""
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.backend_bases import MouseEvent
+from mpl_toolkits.mplot3d import proj3d
+
+from mpldatacursor.datacursor import _FigureDispatcher
+
+# The types of artists that can be created by ``make_artist``
+kinds = ['line', 'steps-pre', 'steps-mid', 'steps-post', 'scatter', 'image',
+         'quadmesh', 'contour', 'contourf', 'bar', 'errorbar', 'errorevery',
+         'line3d', 'scatter3d']
+
+# Creating very large numbers of Rectangles dominates the setup time.
+max_bars = 10**4
+
+def make_artist(kind, npoints):
+    """
+    Create a figure with a single artist of the given *kind* with roughly
+    *npoints* points (or cells, bars, etc).
+
+    Returns
+    -------
+    fig, ax : The figure and axes.
+    artist : The artist, or the container or contour set that should be given
+        to the DataCursor.
+    x, y : The data coordinates of a point on the artist to click on.
+    """
+    np.random.seed(1977)
+    fig = plt.figure()
+    if kind in ['line3d', 'scatter3d']:
+        ax = fig.add_subplot(111, projection='3d')
+    else:
+        ax = fig.add_subplot(111)
+
+    n = int(npoints)
+    i = n // 3
+    side = max(int(np.sqrt(n)), 4)
+    x = np.arange(n, dtype=float)
+    y = np.random.randn(n).cumsum()
+
+    if kind == 'line':
+        artist, = ax.plot(x, y)
+        point = x[i], y[i]
+    elif kind.startswith('steps'):
+        artist, = ax.plot(x, y, drawstyle=kind)
+        point = x[i], y[i]
+    elif kind == 'scatter':
+        x, y = np.random.random((2, n))
+        artist = ax.scatter(x, y, c=y)
+        point = x[i], y[i]
+    elif kind == 'image':
+        artist = ax.imshow(np.random.random((side, side)))
+        point = side / 3.0, side / 3.0
+    elif kind == 'quadmesh':
+        artist = ax.pcolormesh(np.arange(side + 1), np.arange(side + 1),
+                               np.random.random((side, side)))
+        point = side / 3.0 + 0.5, side / 3.0 + 0.5
+    elif kind in ['contour', 'contourf']:
+        grid = np.linspace(0, 4 * np.pi, side)
+        xx, yy = np.meshgrid(grid, grid)
+        func = ax.contourf if kind == 'contourf' else ax.contour
+        artist = func(xx, yy, np.sin(xx) * np.cos(yy))
+        if kind == 'contour':
+            # Click on the middle of a contour line
+            collection = [item for item in artist.collections
+                          if item.get_paths()][0]
+            vertices = collection.get_paths()[0].vertices
+            point = vertices[len(vertices) // 2]
+        else:
+            point = grid[side // 3], grid[side // 3]
+    elif kind == 'bar':
+        nbars = min(n, max_bars)
+        heights = np.random.random(nbars) + 1
+        artist = ax.bar(np.arange(nbars), heights)
+        point = nbars // 3, heights[nbars // 3] / 2
+    elif kind == 'errorbar':
+        artist = ax.errorbar(x, y, yerr=np.random.random(n))
+        point = x[i], y[i]
+    elif kind == 'errorevery':
+        # Only every 10th point has an error bar, so the bars and points
+        # don't line up one-to-one. Click halfway up one of the (long) bars.
+        yerr = np.full(n, 0.25 * np.ptp(y))
+        artist = ax.errorbar(x, y, yerr=yerr, errorevery=10)
+        j = 10 * (i // 10)
+        point = x[j], y[j] + yerr[j] / 2
+    elif kind in ['line3d', 'scatter3d']:
+        z = np.random.randn(n).cumsum()
+        if kind == 'line3d':
+            artist, = ax.plot(x, y, z)
+        else:
+            artist = ax.scatter(x, y, z)
+        point = x[i], y[i], z[i]
+    else:
+        raise ValueError('Unknown kind of artist: {}'.format(kind))
+
+    fig.canvas.draw()
+    if len(point) == 3:
+        # 3D axes' data coordinates are the projected x, y coordinates of the
+        # view at the last draw.
+        point = proj3d.proj_transform(point[0], point[1], point[2], ax.M)[:2]
+    return fig, ax, artist, point
+
+def make_lines(nartists, npoints):
+    """
+    Create a figure with *nartists* random-walk lines of *npoints* each, with
+    each line offset above the previous one. Returns the figure, axes, lines,
+    and the data coordinates of a point on the last (i.e. top) line.
+    """
+    np.random.seed(1977)
+    fig, ax = plt.subplots()
+    x = np.arange(npoints, dtype=float)
+    lines = []
+    for offset in range(nartists):
+        y = np.random.randn(npoints).cumsum() / np.sqrt(npoints) + 10 * offset
+        lines.extend(ax.plot(x, y))
+    fig.canvas.draw()
+    i = npoints // 3
+    return fig, ax, lines, (x[i], lines[-1].get_ydata()[i])
+
+def mouse_event(ax, x, y, name='button_press_event', button=1):
+    """A mouse event at the data coordinates x, y of *ax*."""
+    px, py = ax.transData.transform_point((x, y))
+    return MouseEvent(name, ax.figure.canvas, px, py, button=button)
+
+def pick(dc, event):
+    """Hit-test the mouse *event* for ``dc`` the same way the figure's
+    dispatcher does for a click. Returns the pick event, or None."""
+    dispatcher = _FigureDispatcher.for_figure(event.canvas.figure)
+    return dispatcher._pick(event, [dc], {}).get(dc)
+
+def pick_event(dc, ax, x, y):
+    """
+    The pick event that ``dc`` fires for a click at x, y. Raises
+    NotImplementedError (which makes asv skip the benchmark) if nothing is
+    picked there.
+    """
+    event = pick(dc, mouse_event(ax, x, y))
+    if event is None:
+        raise NotImplementedError('Nothing to pick at {}, {}'.format(x, y))
+    return event
@@ -0,0 +1,51 @@
+"""
+Benchmarks for hit-testing (i.e. finding the artist under the mouse) in
+hover mode. Run with ``asv run`` from the root of the repository.
+"""
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.backend_bases import MouseEvent
+
+from mpldatacursor import spatial_index
+
+class LargeLineHover(object):
+    """Hit-testing a single long time series with ``Line2D.contains`` versus
+    the min/max pyramid used by ``DataCursor(use_index=True)``."""
+    params = [10**5, 10**6, 10**7]
+    param_names = ['points']
+    timeout = 300
+
+    def setup(self, n):
+        np.random.seed(1977)
+        self.fig, self.ax = plt.subplots()
+        self.line, = self.ax.plot(np.arange(n), np.random.randn(n).cumsum())
+        self.line.set_pickradius(5)
+        self.fig.canvas.draw()
+
+        i = n // 3
+        x, y = self.ax.transData.transform([i, self.line.get_ydata()[i]])
+        self.event = MouseEvent('motion_notify_event', self.fig.canvas, x, y)
+        self.index = spatial_index.AxesIndex(self.ax, [self.line])
+        # Build the pyramids outside of the timed functions...
+        self.index.query(x, y)
+        self.pyramid = spatial_index.LinePyramid()
+        self.pyramid.update(self.line)
+
+    def teardown(self, n):
+        plt.close(self.fig)
+
+    def time_contains(self, n):
+        self.line.contains(self.event)
+
+    def time_pyramid(self, n):
+        self.index.query(self.event.x, self.event.y)
+
+    def time_pyramid_build(self, n):
+        spatial_index.LinePyramid().update(self.line)
+
+    def time_pyramid_append(self, n):
+        x, y = self.line.get_data()
+        self.line.set_data(np.append(x, len(x)), np.append(y, y[-1]))
+        self.pyramid.update(self.line)
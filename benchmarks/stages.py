@@ -0,0 +1,171 @@
+"""
+Benchmarks for each stage of handling a mouse event: hit-testing
+(``_FigureDispatcher._pick``), getting information about the pick
+(``event_info``), formatting it (``_formatter``) and updating and redrawing
+the annotation box (``update`` and ``_increment_index``). Run with ``asv run``
+from the root of the repository.
+"""
+import matplotlib.dates as mdates
+import matplotlib.pyplot as plt
+import numpy as np
+
+from mpldatacursor import DataCursor, pick_info
+
+from .common import (kinds, make_artist, make_lines, mouse_event, pick,
+                     pick_event)
+
+class Select(object):
+    """Hit-testing many lines, with the mouse over the last one."""
+    params = [[1, 10, 100], [10**2, 10**4], [False, True]]
+    param_names = ['artists', 'points', 'use_index']
+
+    def setup(self, nartists, npoints, use_index):
+        self.fig, self.ax, lines, point = make_lines(nartists, npoints)
+        self.dc = DataCursor(lines, use_index=use_index)
+        self.event = mouse_event(self.ax, *point)
+        # Build any caches/indexes outside of the timed functions...
+        pick(self.dc, self.event)
+
+    def teardown(self, *args):
+        plt.close(self.fig)
+
+    def time_pick(self, *args):
+        pick(self.dc, self.event)
+
+    def time_pick_and_info(self, *args):
+        self.dc.event_info(pick(self.dc, self.event))
+
+    def time_select_and_draw(self, *args):
+        # The whole click, as handled by the figure's dispatcher. Includes
+        # updating the annotation box and a full redraw, which usually
+        # dominates.
+        self.dc._select(self.event)
+
+class EventInfo(object):
+    """Getting information about a pick on each type of artist."""
+    params = [kinds, [10**3, 10**5]]
+    param_names = ['kind', 'points']
+    timeout = 120
+
+    def setup(self, kind, npoints):
+        self.fig, ax, artist, point = make_artist(kind, npoints)
+        self.dc = DataCursor(artist)
+        self.event = pick_event(self.dc, ax, *point)
+        self.dc.event_info(self.event)
+
+    def teardown(self, *args):
+        plt.close(self.fig)
+
+    def time_event_info(self, *args):
+        self.dc.event_info(self.event)
+
+class ErrorbarInfo(object):
+    """Matching the error bars of an ``errorbar`` plot to its points, with
+    and without ``errorevery``."""
+    params = [[1, 10], [10**3, 10**5]]
+    param_names = ['errorevery', 'points']
+
+    def setup(self, errorevery, npoints):
+        np.random.seed(1977)
+        self.fig, ax = plt.subplots()
+        x = np.arange(npoints, dtype=float)
+        y = np.random.randn(npoints).cumsum()
+        self.container = ax.errorbar(x, y, yerr=np.random.random(npoints),
+                                     errorevery=errorevery)
+        # Make sure each bar is matched to the point it was drawn for.
+        info = pick_info._errorbar_info(self.container)
+        owners, = info['owners'].values()
+        if not np.array_equal(owners, np.arange(0, npoints, errorevery)):
+            raise AssertionError('Error bars matched to the wrong points')
+
+    def teardown(self, *args):
+        plt.close(self.fig)
+
+    def time_errorbar_info(self, *args):
+        # Clear the info cached on the container by the last call.
+        self.container._mpldatacursor_errors = None
+        pick_info._errorbar_info(self.container)
+
+class Formatter(object):
+    """The default formatter with different types of axes."""
+    params = [['linear', 'log', 'date'], [False, True]]
+    param_names = ['scale', 'plain_text']
+
+    def setup(self, scale, plain_text):
+        self.fig, ax, line, point = make_artist('line', 1000)
+        if scale == 'log':
+            ax.set_yscale('symlog')
+        elif scale == 'date':
+            ax.xaxis_date()
+            ax.xaxis.set_major_formatter(mdates.DateFormatter('%x'))
+        self.dc = DataCursor(line, plain_text=plain_text)
+        self.info = self.dc.event_info(pick_event(self.dc, ax, *point))
+        self.dc._formatter(**self.info)
+
+    def teardown(self, *args):
+        plt.close(self.fig)
+
+    def time_formatter(self, *args):
+        self.dc._formatter(**self.info)
+
+class Update(object):
+    """Updating an annotation box, including redrawing the figure."""
+    params = [['line', 'image', 'scatter'], [10**3, 10**5], [False, True]]
+    param_names = ['kind', 'points', 'blit']
+
+    def setup(self, kind, npoints, blit):
+        self.fig, ax, artist, point = make_artist(kind, npoints)
+        self.dc = DataCursor(artist, blit=blit)
+        self.event = pick_event(self.dc, ax, *point)
+        self.dc(self.event)
+        self.annotation = self.dc.annotations[ax]
+        # Cache the background for blitting
+        self.fig.canvas.draw()
+
+    def teardown(self, *args):
+        plt.close(self.fig)
+
+    def time_update(self, *args):
+        self.dc.update(self.event, self.annotation)
+
+class IncrementIndex(object):
+    """Moving the annotation box to the next point with the arrow keys."""
+    params = [['line', 'scatter'], [10**3, 10**5]]
+    param_names = ['kind', 'points']
+
+    def setup(self, kind, npoints):
+        self.fig, ax, artist, point = make_artist(kind, npoints)
+        self.dc = DataCursor(artist)
+        self.dc(pick_event(self.dc, ax, *point))
+        self.fig.canvas.draw()
+
+    def teardown(self, *args):
+        plt.close(self.fig)
+
+    def time_increment_index(self, *args):
+        self.dc._increment_index(1)
+
+class Query(object):
+    """Querying many points at once around the artist (``DataCursor.query``),
+    with and without formatting the text of each point."""
+    params = [['line', 'scatter', 'image', 'quadmesh'], [10**3, 10**5],
+              [False, True]]
+    param_names = ['kind', 'queries', 'text']
+    timeout = 120
+
+    def setup(self, kind, nqueries, text):
+        self.fig, ax, artist, point = make_artist(kind, 10**4)
+        self.dc = DataCursor(artist)
+        self.fig.canvas.draw()
+        # Points scattered around the point on the artist.
+        x0, x1 = ax.get_xlim()
+        y0, y1 = ax.get_ylim()
+        self.x = point[0] + (x1 - x0) * 0.05 * np.random.randn(nqueries)
+        self.y = point[1] + (y1 - y0) * 0.05 * np.random.randn(nqueries)
+        self.dc.query(self.x[:10], self.y[:10], text=text)
+
+    def teardown(self, *args):
+        plt.close(self.fig)
+
+    def time_query(self, kind, nqueries, text):
+        self.dc.query(self.x, self.y, text=text)
@@ -23,4 +23,8 @@ __version__ = '0.6-dev'
 
 from .convenience import datacursor
 from .datacursor import DataCursor, HighlightingDataCursor
-__all__ = ['datacursor', 'DataCursor', 'HighlightingDataCursor']
+from .pick_info import register_pick_info
+from .stats import LatencyStats
+from .pinned import PinnedAnnotations
+__all__ = ['datacursor', 'DataCursor', 'HighlightingDataCursor',
+           'register_pick_info', 'LatencyStats', 'PinnedAnnotations']
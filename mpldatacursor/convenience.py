@@ -23,7 +23,7 @@ from matplotlib import _pylab_helpers as pylab_helpers
 from matplotlib import cbook
 import numpy as np
 
-from .datacursor import DataCursor
+from .datacursor import DataCursor, _plotted_artists
 
 def datacursor(artists=None, axes=None, **kwargs):
     """
@@ -139,7 +139,55 @@ def datacursor(artists=None, axes=None, **kwargs):
     keep_inside : boolean, optional
         Whether or not to adjust the x,y offset to keep the text box inside the
         figure. This option has no effect on draggable datacursors. Defaults to
-        True. Note: Currently disabled on OSX and NbAgg/notebook backends.
+        True.
+    use_index : boolean, optional
+        If True, hit-test ``Line2D`` and ``scatter`` artists through a
+        screen-space grid index for each axes instead of calling
+        ``artist.contains`` on every artist for every mouse event. This is
+        much faster for figures with many artists or very many points. Other
+        artist types are hit-tested as usual. Defaults to False.
+    blit : boolean, optional
+        If True, only the annotation boxes (and highlights) are redrawn when
+        they change, instead of the entire figure. This is much faster for
+        figures that are expensive to draw. Falls back to
+        ``canvas.draw_idle`` on backends that don't support blitting. Note
+        that annotation boxes won't appear in figures saved with ``savefig``
+        in this mode. Defaults to False.
+    max_hover_rate : number or None, optional
+        The maximum number of times per second that the datacursor will be
+        updated in hover mode. Mouse motion events that arrive faster than
+        this are coalesced, and only the most recent one is processed once the
+        interval has passed. Defaults to None (no limit).
+    hover_threshold : number, optional
+        In hover mode, mouse motion of less than this many pixels from the
+        last processed position is ignored. Defaults to 0.
+    source_data : dict or None, optional
+        A mapping of image artists to the arrays that values should be looked
+        up in (e.g. memory-mapped arrays). Only the element under the cursor
+        is read from them. Contour sets may be mapped to the ``(X, Y, Z)``
+        arrays they were created from to display the interpolated value of
+        ``Z`` instead of the contour level. Defaults to None.
+    plain_text : boolean, optional
+        If True, coordinates are formatted without mathtext and annotation
+        text isn't parsed for math, which makes redrawing cheaper. Defaults
+        to False.
+    stats : boolean or LatencyStats instance, optional
+        If True (or a ``LatencyStats`` instance), record how long each stage
+        of handling mouse events takes in ``dc.stats``, including rolling
+        percentiles. Defaults to None.
+    max_annotations : int, optional
+        The maximum number of annotation boxes shown at once when
+        ``display="multiple"``. The least recently updated box is removed to
+        make room for a new one. Defaults to None (no limit).
+    batched : boolean, optional
+        If True and ``display="multiple"``, draw all annotation boxes in a
+        figure with a single batched artist. This is much faster with many
+        annotations. Defaults to False.
+    auto_add : boolean or sequence of axes, optional
+        If True, artists plotted later on `axes` are made selectable the next
+        time the figure is drawn, and removed artists are dropped. (Use
+        ``dc.add_artists`` and ``dc.remove_artists`` to do this manually.)
+        Defaults to False.
     **kwargs : additional keyword arguments, optional
         Additional keyword arguments are passed on to annotate.
 
@@ -147,11 +195,6 @@ def datacursor(artists=None, axes=None, **kwargs):
     -------
     dc : A ``mpldatacursor.DataCursor`` instance
     """
-    def plotted_artists(ax):
-        artists = (ax.lines + ax.patches + ax.collections
-                   + ax.images + ax.containers)
-        return artists
-
     # If no axes are specified, get all axes.
     if axes is None:
         managers = pylab_helpers.Gcf.get_all_fig_managers()
@@ -164,6 +207,10 @@ def datacursor(artists=None, axes=None, **kwargs):
     # If no artists are specified, get all manually plotted artists in all of
     # the specified axes.
     if artists is None:
-        artists = [artist for ax in axes for artist in plotted_artists(ax)]
+        artists = [artist for ax in axes for artist in _plotted_artists(ax)]
+
+    # Watch all of the specified axes, even those with nothing plotted yet.
+    if kwargs.get('auto_add') is True:
+        kwargs['auto_add'] = axes
 
     return DataCursor(artists, **kwargs)
@@ -19,25 +19,65 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
-import itertools
+import collections
 import copy
+import time
 import numpy as np
 from matplotlib import cbook
 from matplotlib import offsetbox
 
 import matplotlib
 from matplotlib.contour import ContourSet
+from matplotlib.collections import QuadMesh
 from matplotlib.image import AxesImage
-from matplotlib.collections import PathCollection, LineCollection
-from matplotlib.collections import PatchCollection, PolyCollection, QuadMesh
 from matplotlib.container import Container
-from matplotlib.lines import Line2D
-from matplotlib.patches import Rectangle
 import matplotlib.dates as mdates
 from matplotlib.ticker import ScalarFormatter
-from matplotlib.backend_bases import PickEvent
+from matplotlib.transforms import Bbox
+from matplotlib.backend_bases import PickEvent, MouseEvent
+from mpl_toolkits.mplot3d import Axes3D, proj3d
 
 from . import pick_info
+from . import spatial_index
+from . import text_metrics
+from .stats import LatencyStats, timer
+from .pinned import PinnedAnnotations
+
+def _filter_artists(artists):
+    """Replace ContourSets, etc with their constituent artists."""
+    output = []
+    for item in artists:
+        if isinstance(item, ContourSet):
+            output += item.collections
+        elif isinstance(item, Container):
+            children = item.get_children()
+            for child in children:
+                child._mpldatacursor_label = item.get_label()
+                child._mpldatacursor_parent = item
+            output += children
+        else:
+            output.append(item)
+    return output
+
+def _plotted_artists(ax):
+    """All manually plotted artists in *ax*."""
+    return ax.lines + ax.patches + ax.collections + ax.images + ax.containers
+
+def _children_state(ax):
+    """
+    A cheap summary of the children of *ax*: the length and last item of
+    each list of children. New artists are always added to the end, so this
+    changes whenever an artist is added or removed.
+    """
+    children = getattr(ax, '_children', None)
+    if children is not None:
+        lists = [children, ax.containers]
+    else:
+        # Older versions of mpl keep a separate list for each type.
+        lists = [ax.lines, ax.patches, ax.collections, ax.images,
+                 ax.containers]
+    return tuple((len(items), items[-1] if len(items) else None)
+                 for items in lists)
 
 class DataCursor(object):
     """A simple data cursor widget that displays the x,y location of a
@@ -59,7 +99,10 @@ class DataCursor(object):
                  display='one-per-axes', draggable=False, hover=False,
                  props_override=None, keybindings=True, date_format='%x %X',
                  display_button=1, hide_button=3, keep_inside=True,
-                 **kwargs):
+                 use_index=False, blit=False, max_hover_rate=None,
+                 hover_threshold=0, source_data=None, plain_text=False,
+                 stats=None, max_annotations=None, batched=False,
+                 auto_add=False, **kwargs):
         """Create the data cursor and connect it to the relevant figure.
 
         Parameters
@@ -123,28 +166,74 @@ class DataCursor(object):
         keep_inside : boolean, optional
             Whether or not to adjust the x,y offset to keep the text box inside
             the figure. This option has no effect on draggable datacursors.
-            Defaults to True. Note: Currently disabled on OSX and
-            NbAgg/notebook backends.
+            Defaults to True.
+        use_index : boolean, optional
+            If True, hit-test ``Line2D`` and ``scatter`` artists through a
+            screen-space grid index for each axes instead of calling
+            ``artist.contains`` on every artist for every mouse event. This is
+            much faster for figures with many artists or very many points.
+            Other artist types are hit-tested as usual. Defaults to False.
+        blit : boolean, optional
+            If True, only the annotation boxes (and highlights) are redrawn
+            when they change, instead of the entire figure. The rest of the
+            figure is cached after each full draw. This is much faster for
+            figures that are expensive to draw (e.g. large images or meshes).
+            Falls back to ``canvas.draw_idle`` on backends that don't support
+            blitting. Note that annotation boxes are animated artists in this
+            mode, so they won't appear in figures saved with ``savefig``.
+            Defaults to False.
+        max_hover_rate : number or None, optional
+            The maximum number of times per second that the datacursor will
+            be updated in hover mode. Mouse motion events that arrive faster
+            than this are coalesced, and only the most recent one is processed
+            once the interval has passed. Defaults to None (no limit).
+        hover_threshold : number, optional
+            In hover mode, mouse motion of less than this many pixels from
+            the last processed position is ignored. Defaults to 0.
+        source_data : dict or None, optional
+            A mapping of image artists to the arrays that values should be
+            looked up in (e.g. ``{im: np.load(fname, mmap_mode='r')}``).
+            Only the element under the cursor is read from these arrays, so
+            memory-mapped or otherwise lazily loaded arrays are never read in
+            full. The array must have the same shape as the image's array.
+            Contour sets may also be mapped to the ``(X, Y, Z)`` arrays (or
+            just ``Z``) they were created from (``X`` and ``Y`` must be
+            rectilinear). The bilinearly interpolated value of ``Z`` at the
+            mouse will then be displayed instead of the contour level.
+            Defaults to None.
+        plain_text : boolean, optional
+            If True, coordinates are formatted without mathtext and the text
+            of annotation boxes isn't parsed for math (on matplotlib versions
+            that support this). This makes redrawing annotation boxes
+            cheaper. Defaults to False.
+        stats : boolean or LatencyStats instance, optional
+            If True (or a ``LatencyStats`` instance), record how long each
+            stage of handling mouse events takes (hit-testing, pick info, the
+            formatter, redrawing, etc) in ``self.stats``. See
+            ``mpldatacursor.LatencyStats``. Defaults to None (not recorded).
+        max_annotations : int, optional
+            The maximum number of annotation boxes shown at once when
+            ``display="multiple"``. When the limit is reached, the least
+            recently shown or updated annotation box is removed to make room
+            for a new one. Defaults to None (no limit).
+        batched : boolean, optional
+            If True and ``display="multiple"``, the annotation boxes are all
+            drawn by a single ``PinnedAnnotations`` artist per figure instead
+            of each being a separate ``Annotation``. This is much faster to
+            draw with hundreds or thousands of annotations. The boxes have
+            leader lines and markers instead of arrows. Defaults to False.
+        auto_add : boolean or sequence of axes, optional
+            If True, artists that are plotted later on the axes of *artists*
+            are added to the datacursor (see ``add_artists``) the next time
+            the figure is drawn. Artists that have been removed from their
+            axes are removed from the datacursor. Alternatively, a sequence
+            of the axes to watch may be given. Defaults to False.
         **kwargs : additional keyword arguments, optional
             Additional keyword arguments are passed on to annotate.
         """
-        def filter_artists(artists):
-            """Replace ContourSets, etc with their constituent artists."""
-            output = []
-            for item in artists:
-                if isinstance(item, ContourSet):
-                    output += item.collections
-                elif isinstance(item, Container):
-                    children = item.get_children()
-                    for child in children:
-                        child._mpldatacursor_label = item.get_label()
-                        child._mpldatacursor_parent = item
-                    output += children
-                else:
-                    output.append(item)
-            return output
-
-        if not np.iterable(artists):
+        # Containers (e.g. from errorbar) are tuples, but should be treated
+        # as a single artist.
+        if not np.iterable(artists) or isinstance(artists, Container):
             artists = [artists]
 
         #-- Deal with contour sets... -------------------------------------
@@ -152,13 +241,15 @@ class DataCursor(object):
         # is never associated with the ContourSet, and they're not "normal"
         # artists (they're not actually added to the axes). Not only that, but
         # the PatchCollections created by filled contours don't even fire a
-        # pick event for points inside them, only on their edges. At any rate,
-        # this is a somewhat hackish way of handling contours, but it works.
-        self.artists = filter_artists(artists)
+        # pick event for points inside them, only on their edges. Therefore,
+        # filled contours are hit-tested against their polygons when picking.
+        self.artists = _filter_artists(artists)
+        # For fast membership tests (``self.artists`` keeps the order).
+        self._artist_set = set(self.artists)
         self.contour_levels = {}
+        self._contour_sets = {}
         for cs in [x for x in artists if isinstance(x, ContourSet)]:
-            for z, artist in zip(cs.levels, cs.collections):
-                self.contour_levels[artist] = z
+            self._add_contour_set(cs)
 
         valid_display_options = ['single', 'one-per-axes', 'multiple']
         if display in valid_display_options:
@@ -179,9 +270,35 @@ class DataCursor(object):
         self.props_override = props_override
         self.display_button = display_button
         self.hide_button = hide_button
+        self.use_index = use_index
+        self._indexes = {}
+        self.blit = blit
+        self.max_hover_rate = max_hover_rate
+        self.hover_threshold = hover_threshold
+        self._pending_motion = None
+        self._last_motion_xy = None
+        self._last_motion_time = 0
+        self._hovering = False
+        self._deferred_redraws = None
+        self.source_data = source_data or {}
+        for artist, source in self.source_data.items():
+            if isinstance(artist, ContourSet):
+                if np.ndim(source) == 2:
+                    nrows, ncols = np.shape(source)
+                    source = np.arange(ncols), np.arange(nrows), source
+                grid = pick_info.grid_interpolator(*source)
+                for collection in artist.collections:
+                    collection._mpldatacursor_source = grid
+            else:
+                artist._mpldatacursor_source = source
         self.axes = tuple(set(art.axes for art in self.artists))
         self.figures = tuple(set(ax.figure for ax in self.axes))
-        self._mplformatter = ScalarFormatter(useOffset=False, useMathText=True)
+        self._artists_by_axes = self._group_artists()
+        self.plain_text = plain_text
+        if stats is True:
+            stats = LatencyStats()
+        self.stats = stats or None
+        self._coord_formatters = {}
         self._hidden = False
         self._last_event = None
         self._last_annotation = None
@@ -198,32 +315,73 @@ class DataCursor(object):
             self.formatter = formatter
 
         self._annotation_kwargs = kwargs
-        self.annotations = {}
-        if self.display != 'multiple':
-            for ax in self.axes:
-                self.annotations[ax] = self.annotate(ax, **kwargs)
-                # Hide the annotation box until clicked...
-                self.annotations[ax].set_visible(False)
-
+        self.max_annotations = max_annotations
+        # For display="multiple", annotations are keyed by the mouse event
+        # that created them, least recently updated first. Hidden annotation
+        # boxes are kept (per axes) to be reused instead of creating new ones.
+        self.annotations = collections.OrderedDict()
+        self._annotation_keys = {}
+        self._spare_annotations = {}
+        self.batched = batched and self.display == 'multiple'
+        self._pinned_layers = {}
+        for ax in self.axes:
+            self._setup_axes(ax)
+
+        self.keybindings = None
         if keybindings:
             if keybindings is True:
                 self.keybindings = self.default_keybindings
             else:
                 self.keybindings = self.default_keybindings.copy()
                 self.keybindings.update(keybindings)
-            for fig in self.figures:
-                fig.canvas.mpl_connect('key_press_event', self._on_keypress)
+
+        # Artists plotted later on these axes are added when the figure is
+        # drawn (see ``self._discover_artists``).
+        if auto_add is True:
+            auto_add = self.axes
+        self._watched_axes = tuple(auto_add or ())
+        self._children_states = {}
+        for fig in set(ax.figure for ax in self._watched_axes):
+            fig.canvas.mpl_connect('draw_event', self._discover_artists)
+            self._keep_alive(fig)
+
+        for fig in self.figures:
+            self._setup_figure(fig)
 
         self.enable()
 
+    def _setup_axes(self, ax):
+        """Create the annotation box (if needed) and connect the callbacks
+        for a newly managed axes."""
+        if self.display != 'multiple':
+            self.annotations[ax] = self.annotate(ax, **self._annotation_kwargs)
+            # Hide the annotation box until clicked...
+            self.annotations[ax].set_visible(False)
+
+        if self.blit:
+            ax.callbacks.connect('xlim_changed', self._on_lims_changed)
+            ax.callbacks.connect('ylim_changed', self._on_lims_changed)
+
+    def _setup_figure(self, fig):
+        """Connect the callbacks for a newly managed figure. (Mouse events
+        are connected by ``self.enable``.)"""
+        if self.keybindings:
+            _FigureDispatcher.for_figure(fig).add_keys(self)
+
+        if self.blit:
+            _FigureDispatcher.for_figure(fig).add_blit(self)
+
+        self._keep_alive(fig)
+
+    def _keep_alive(self, fig):
         # We need to make sure the DataCursor isn't garbage collected until the
         # figure is.  Matplotlib's weak references won't keep this DataCursor
         # instance alive in all cases.
-        for fig in self.figures:
-            try:
+        try:
+            if self not in fig._mpldatacursors:
                 fig._mpldatacursors.append(self)
-            except AttributeError:
-                fig._mpldatacursors = [self]
+        except AttributeError:
+            fig._mpldatacursors = [self]
 
     def __call__(self, event):
         """Create or update annotations for the given event. (This is intended
@@ -243,7 +401,7 @@ class DataCursor(object):
         # Ignore non-hiding pick events for the annotation box itself
         # (otherwise, draggable annotation boxes won't work) and pick
         # events not for the artists that this data cursor manages.
-        if event.artist not in self.artists:
+        if event.artist not in self._artist_set:
             return True
 
         if not self.hover:
@@ -264,8 +422,13 @@ class DataCursor(object):
             # when several artists are selected.
             annotation = self.annotations[event.mouseevent]
         else:
-            annotation = self.annotate(ax, **self._annotation_kwargs)
+            if self.max_annotations is not None:
+                while len(self.annotations) >= max(self.max_annotations, 1):
+                    stale = next(iter(self.annotations.values()))
+                    self._remove_annotation(stale)
+            annotation = self._new_annotation(ax)
             self.annotations[event.mouseevent] = annotation
+            self._annotation_keys[annotation] = event.mouseevent
 
         if self.display == 'single':
             # Hide any other annotation boxes...
@@ -275,37 +438,18 @@ class DataCursor(object):
         self.update(event, annotation)
 
     def event_info(self, event):
-        """Get a dict of info for the artist selected by "event"."""
-        def default_func(event):
-            return {}
-        registry = {
-                AxesImage : [pick_info.image_props],
-                PathCollection : [pick_info.scatter_props, self._contour_info,
-                                  pick_info.collection_props],
-                Line2D : [pick_info.line_props, pick_info.errorbar_props],
-                LineCollection : [pick_info.collection_props,
-                                  self._contour_info,
-                                  pick_info.errorbar_props],
-                PatchCollection : [pick_info.collection_props,
-                                   self._contour_info],
-                PolyCollection : [pick_info.collection_props,
-                                  pick_info.scatter_props],
-                QuadMesh : [pick_info.collection_props],
-                Rectangle : [pick_info.rectangle_props],
-                }
+        """
+        Get a dict of info for the artist selected by "event". Uses the
+        functions registered with ``pick_info.register_pick_info`` for the
+        type of the artist."""
         x, y = event.mouseevent.xdata, event.mouseevent.ydata
         props = dict(x=x, y=y, label=event.artist.get_label(), event=event)
         props['ind'] = getattr(event, 'ind', None)
         props['point_label'] = self._point_label(event)
 
-        funcs = registry.get(type(event.artist), [default_func])
-
-        # 3D artist don't share inheritance. Fall back to naming convention.
-        if '3D' in type(event.artist).__name__:
-            funcs += [pick_info.three_dim_props]
-
-        for func in funcs:
+        for func in pick_info.get_pick_info_funcs(type(event.artist)):
             props.update(func(event))
+        props.update(self._contour_info(event))
 
         return props
 
@@ -320,9 +464,27 @@ class DataCursor(object):
         except:
             return None
 
+    def _add_contour_set(self, cs):
+        """Keep track of the levels of a ContourSet's artists."""
+        for z, artist in zip(cs.levels, cs.collections):
+            self.contour_levels[artist] = z
+            if cs.filled:
+                self._contour_sets[artist] = cs
+
     def _contour_info(self, event):
         """Get the z-value for a pick event on an artists in a contour set."""
-        return {'z':self.contour_levels.get(event.artist, None)}
+        if event.artist not in self.contour_levels:
+            return {}
+        # Contour collections have a single dummy offset that scatter_props
+        # would otherwise "snap" x & y to.
+        x, y = event.mouseevent.xdata, event.mouseevent.ydata
+        z = self.contour_levels[event.artist]
+        grid = getattr(event.artist, '_mpldatacursor_source', None)
+        if grid is not None:
+            value = pick_info.interpolate_grid(grid, x, y)
+            if value is not None:
+                z = value
+        return {'z':z, 'x':x, 'y':y}
 
     def _formatter(self, x=None, y=None, z=None, s=None, label=None, **kwargs):
         """
@@ -346,14 +508,16 @@ class DataCursor(object):
         else:
             limits = ax.get_xlim()
             x = self._format_coord(x, ax.xaxis)
-            kwargs['xerror'] = self._format_coord(kwargs.get('xerror'), ax.xaxis)
+            for key in ['xerror', 'xerror_lower', 'xerror_upper']:
+                kwargs[key] = self._format_coord(kwargs.get(key), ax.xaxis)
 
         if is_date(ax.yaxis):
             y = format_date(y)
         else:
             limits = ax.get_ylim()
             y = self._format_coord(y, ax.yaxis)
-            kwargs['yerror'] = self._format_coord(kwargs.get('yerror'), ax.yaxis)
+            for key in ['yerror', 'yerror_lower', 'yerror_upper']:
+                kwargs[key] = self._format_coord(kwargs.get(key), ax.yaxis)
 
         output = []
         for key, val in zip(['x', 'y', 'z', 's'], [x, y, z, s]):
@@ -375,8 +539,12 @@ class DataCursor(object):
 
         for arg in ['xerror', 'yerror']:
             val = kwargs.get(arg, None)
+            lower = kwargs.get(arg + '_lower', None)
+            upper = kwargs.get(arg + '_upper', None)
             if val is not None:
                 output.append(u'{}: {}'.format(arg, val))
+            elif lower is not None and upper is not None:
+                output.append(u'{}: -{} / +{}'.format(arg, lower, upper))
 
         return u'\n'.join(output)
 
@@ -394,8 +562,27 @@ class DataCursor(object):
         if x is None:
             return None
 
-        limits = axis.get_view_interval()
-        formatter = self._mplformatter
+        formatter = self._coord_formatter(axis)
+        try:
+            # Again, older versions of mpl
+            return formatter.pprint_val(x)
+        except AttributeError:
+            # 3.3.0 or later
+            return formatter.format_data_short(x)
+
+    def _coord_formatter(self, axis):
+        """
+        Get the ScalarFormatter used by ``_format_coord`` for *axis*. There's
+        one formatter per axis, and it's only set up again when the axis'
+        view interval changes.
+        """
+        limits = tuple(axis.get_view_interval())
+        cached = self._coord_formatters.get(axis)
+        if cached is not None and cached[0] == limits:
+            return cached[1]
+
+        formatter = ScalarFormatter(useOffset=False,
+                                    useMathText=not self.plain_text)
         # Trick the formatter into thinking we have an axes
         # The 7 tick locations is arbitrary but gives a reasonable detail level
         formatter.locs = np.linspace(limits[0], limits[1], 7)
@@ -409,14 +596,9 @@ class DataCursor(object):
             formatter.axis = axis
             formatter._set_format()
             formatter._set_order_of_magnitude()
-        
-        try:
-            # Again, older versions of mpl
-            return formatter.pprint_val(x)
-        except AttributeError:
-            # 3.3.0 or later
-            return formatter.format_data_short(x)
 
+        self._coord_formatters[axis] = (limits, formatter)
+        return formatter
 
     def annotate(self, ax, **kwargs):
         """
@@ -444,11 +626,21 @@ class DataCursor(object):
 
         annotation = ax.annotate('This text will be reset', **kwargs)
         annotation._has_been_shown = False
+        try:
+            annotation._mpldatacursor_xyann = annotation.xyann
+        except AttributeError:
+            annotation._mpldatacursor_xyann = annotation.xytext
+        if self.plain_text and hasattr(annotation, 'set_parse_math'):
+            annotation.set_parse_math(False)
 
         # Place the annotation in the figure instead of the axes so that it
         # doesn't get hidden behind other subplots (zorder won't fix that).
         ax.figure.texts.append(ax.texts.pop())
 
+        # Blitted annotation boxes are drawn separately from the figure.
+        if self.blit and self._can_blit(ax.figure):
+            annotation.set_animated(True)
+
         # Create a draggable annotation box, if required.
         if self.draggable:
             offsetbox.DraggableAnnotation(annotation)
@@ -487,7 +679,7 @@ class DataCursor(object):
         for artist in self.annotations.values():
             artist.set_visible(False)
         for fig in self.figures:
-            fig.canvas.draw()
+            self._redraw(fig)
         return self
 
     def show(self):
@@ -497,7 +689,7 @@ class DataCursor(object):
             if artist._has_been_shown:
                 artist.set_visible(True)
         for fig in self.figures:
-            fig.canvas.draw()
+            self._redraw(fig)
         return self
 
     def _hide_box(self, annotation):
@@ -505,12 +697,65 @@ class DataCursor(object):
         annotation.set_visible(False)
 
         if self.display == 'multiple':
-            annotation.axes.figure.texts.remove(annotation)
-            # Remove the annotation from self.annotations.
-            lookup = dict((self.annotations[k], k) for k in self.annotations)
-            del self.annotations[lookup[annotation]]
+            self._remove_annotation(annotation)
+
+        self._redraw(annotation.figure)
+
+    def _new_annotation(self, ax):
+        """Get an annotation box for *ax* when ``display="multiple"``,
+        reusing a previously removed one if possible."""
+        spares = self._spare_annotations.get(ax)
+        if not spares:
+            if self.batched:
+                return self._pin(ax)
+            return self.annotate(ax, **self._annotation_kwargs)
+
+        annotation = spares.pop()
+        # Undo any dragging or flipping by keep_inside. (annotation.xyann
+        # doesn't exist in older mpl versions.)
+        if hasattr(annotation, 'xyann'):
+            annotation.xyann = annotation._mpldatacursor_xyann
+        else:
+            annotation.xytext = annotation._mpldatacursor_xyann
+        self._adjust_alignment(annotation)
+        return annotation
 
-        annotation.figure.canvas.draw()
+    def _pin(self, ax):
+        """Create a new annotation in the batched layer for *ax*'s figure."""
+        fig = ax.figure
+        layer = self._pinned_layers.get(fig)
+        if layer is None:
+            kwargs = dict(self.default_annotation_kwargs)
+            kwargs.update(self._annotation_kwargs)
+            layer = PinnedAnnotations(fig, draggable=self.draggable, **kwargs)
+            if self.blit and self._can_blit(fig):
+                layer.set_animated(True)
+            try:
+                fig.add_artist(layer)
+            except AttributeError:
+                # Older versions of mpl don't have Figure.add_artist
+                fig.artists.append(layer)
+            self._pinned_layers[fig] = layer
+
+        pin = layer.pin(ax)
+        pin._has_been_shown = False
+        pin._mpldatacursor_xyann = pin.xyann
+        self._user_set_ha = ('ha' in self._annotation_kwargs or
+                             'horizontalalignment' in self._annotation_kwargs)
+        self._user_set_va = ('va' in self._annotation_kwargs or
+                             'verticalalignment' in self._annotation_kwargs)
+        self._adjust_alignment(pin)
+        return pin
+
+    def _remove_annotation(self, annotation):
+        """Hide an annotation box shown with ``display="multiple"`` and keep
+        it to be reused."""
+        key = self._annotation_keys.pop(annotation)
+        del self.annotations[key]
+        annotation.set_visible(False)
+        annotation._has_been_shown = False
+        self._spare_annotations.setdefault(annotation.axes, []).append(
+                annotation)
 
     def disable(self):
         """
@@ -520,47 +765,169 @@ class DataCursor(object):
         to allow "chaining". (e.g. ``datacursor.hide().disable()``)
         """
         if self._enabled:
-            for fig, cids in self._cids:
-                for cid in cids:
-                    fig.canvas.mpl_disconnect(cid)
+            for fig in self.figures:
+                _FigureDispatcher.for_figure(fig).remove(self)
+            self._pending_motion = None
             self._enabled = False
         return self
 
     def enable(self):
         """Connects callbacks and makes artists pickable. If the datacursor has
         already been enabled, this function has no effect."""
-        def connect(fig):
-            if self.hover:
-                event = 'motion_notify_event'
-            else:
-                event = 'button_press_event'
-            cids = [fig.canvas.mpl_connect(event, self._select)]
-
-            # None of this should be necessary. Workaround for a bug in some
-            # mpl versions
-            try:
-                proxy = fig.canvas.callbacks.BoundMethodProxy(self)
-                fig.canvas.callbacks.callbacks[event][cids[-1]] = proxy
-            except AttributeError:
-                # In some versions of mpl, BoundMethodProxy doesn't exist...
-                # See: https://github.com/joferkington/mpldatacursor/issues/2
-                pass
-            return cids
-
+        # Mouse events are handled by a dispatcher shared by all datacursors
+        # in the same figure (see ``_FigureDispatcher``).
         if not getattr(self, '_enabled', False):
-            self._cids = [(fig, connect(fig)) for fig in self.figures]
+            for fig in self.figures:
+                _FigureDispatcher.for_figure(fig).add(self)
             self._enabled = True
-            try:
-                # Newer versions of MPL use set_pickradius
-                for artist in self.artists:
-                    artist.set_pickradius(self.tolerance)
-            except AttributeError:
-                # Older versions of MPL control pick radius through set_picker
-                for artist in self.artists:
-                    artist.set_picker(self.tolerance)
+            self._set_pickradius(self.artists)
 
         return self
 
+    def _set_pickradius(self, artists):
+        try:
+            # Newer versions of MPL use set_pickradius
+            for artist in artists:
+                artist.set_pickradius(self.tolerance)
+        except AttributeError:
+            # Older versions of MPL control pick radius through set_picker
+            for artist in artists:
+                artist.set_picker(self.tolerance)
+
+    def add_artists(self, artists):
+        """
+        Make additional artists selectable. *artists* may be anything that
+        can be passed in when creating the datacursor (e.g. a single artist,
+        a sequence of artists, a ContourSet, or a container). Artists that are
+        already managed by the datacursor are ignored. Artists may be in axes
+        or figures that the datacursor didn't manage before. Returns self to
+        allow "chaining".
+        """
+        if not np.iterable(artists) or isinstance(artists, Container):
+            artists = [artists]
+        new = [artist for artist in _filter_artists(artists)
+               if artist not in self._artist_set]
+        # Remove duplicates, keeping the order.
+        new = list(collections.OrderedDict.fromkeys(new))
+        if not new:
+            return self
+
+        for cs in [x for x in artists if isinstance(x, ContourSet)]:
+            self._add_contour_set(cs)
+        self.artists.extend(new)
+        self._artist_set.update(new)
+
+        for artist in new:
+            ax = artist.axes
+            self._add_to_group(artist)
+            if ax not in self.axes:
+                self.axes += (ax,)
+                self._setup_axes(ax)
+            if ax.figure not in self.figures:
+                self.figures += (ax.figure,)
+                self._setup_figure(ax.figure)
+            if ax in self._indexes and artist not in self.contour_levels:
+                self._indexes[ax].add([artist])
+
+        if self._enabled:
+            self._set_pickradius(new)
+            for fig in set(artist.figure for artist in new):
+                dispatcher = _FigureDispatcher.for_figure(fig)
+                dispatcher.add(self)
+                dispatcher.add_artists(self, new)
+        return self
+
+    def remove_artists(self, artists):
+        """
+        Stop managing *artists* (in any form accepted by ``add_artists``).
+        The artists may have already been removed from their axes. Any
+        visible annotation boxes are left as they are. Returns self to allow
+        "chaining".
+        """
+        if not np.iterable(artists) or isinstance(artists, Container):
+            artists = [artists]
+        gone = set(artist for artist in _filter_artists(artists)
+                   if artist in self._artist_set)
+        if not gone:
+            return self
+
+        self.artists = [artist for artist in self.artists
+                        if artist not in gone]
+        self._artist_set -= gone
+        for artist in gone:
+            self.contour_levels.pop(artist, None)
+            self._contour_sets.pop(artist, None)
+
+        # Removed artists may no longer have an axes, so search for them.
+        groups = []
+        for ax, members, clipped in self._artists_by_axes:
+            if any(artist in gone for artist in members):
+                members = [artist for artist in members if artist not in gone]
+                clipped = all(artist.get_clip_on() for artist in members)
+            if members:
+                groups.append((ax, members, clipped))
+        self._artists_by_axes = groups
+        for index in self._indexes.values():
+            index.remove(gone)
+        for fig in self.figures:
+            _FigureDispatcher.for_figure(fig).remove_artists(self, gone)
+
+        if self._last_event is not None and self._last_event.artist in gone:
+            self._last_event = None
+            self._last_annotation = None
+        return self
+
+    def _discover_artists(self, event):
+        """
+        Add artists that have been plotted on the watched axes of a figure
+        since it was last drawn and remove artists that have been removed
+        from their axes (see the *auto_add* kwarg).
+        """
+        # Only look through the children of axes that have changed.
+        changed = []
+        for ax in self._watched_axes:
+            if ax.figure is not event.canvas.figure:
+                continue
+            state = _children_state(ax)
+            if state != self._children_states.get(ax):
+                self._children_states[ax] = state
+                changed.append(ax)
+        if not changed:
+            return
+
+        gone = [artist for artist in self.artists if artist.axes is None]
+        if gone:
+            self.remove_artists(gone)
+        new = [artist for ax in changed for artist in _plotted_artists(ax)
+               if artist not in self._artist_set
+               and not getattr(artist, '_mpldatacursor_ignore', False)]
+        if new:
+            self.add_artists(new)
+
+    def _accept_motion(self, event):
+        """
+        Decide whether a mouse motion event should be processed in hover
+        mode. Motion within ``self.hover_threshold`` pixels of the last
+        processed event is ignored. Otherwise, the event becomes the pending
+        motion event, which is processed once ``self.max_hover_rate`` allows.
+        """
+        if self.stats is not None:
+            self.stats.increment('motion_events')
+        if self.hover_threshold and self._last_motion_xy is not None:
+            x0, y0 = self._last_motion_xy
+            if np.hypot(event.x - x0, event.y - y0) < self.hover_threshold:
+                if self.stats is not None:
+                    self.stats.increment('motion_skipped')
+                return False
+        self._pending_motion = event
+        return True
+
+    def _motion_wait(self, now):
+        """Seconds until the pending motion event may be processed."""
+        if not self.max_hover_rate:
+            return 0
+        return self._last_motion_time + 1.0 / self.max_hover_rate - now
+
     def _set_enabled(self, value):
         if value:
             self.enable()
@@ -572,42 +939,59 @@ class DataCursor(object):
     def update(self, event, annotation):
         """Update the specified annotation."""
         # Get artist-specific information about the pick event
-        info = self.event_info(event)
+        info = self._timed('event_info', self.event_info, event)
 
         if self.props_override is not None:
-            info = self.props_override(**info)
+            info = self._timed('props_override', self.props_override, **info)
 
         # Update the xy position and text using the formatter function
-        annotation.set_text(self.formatter(**info))
+        annotation.set_text(self._timed('formatter', self.formatter, **info))
         annotation.xy = info['x'], info['y']
 
         # Unfortnately, 3D artists are a bit more complex...
-        # Also, 3D artists don't share inheritance. Use naming instead.
-        if '3D' in type(event.artist).__name__:
+        # The annotation points to the projection of the (possibly snapped)
+        # 3D point, if there is one.
+        ax = event.artist.axes
+        if isinstance(ax, Axes3D):
             annotation.xy = event.mouseevent.xdata, event.mouseevent.ydata
+            if info.get('z') is not None and ax.M is not None:
+                x, y, _ = proj3d.proj_transform(info['x'], info['y'],
+                                                info['z'], ax.M)
+                annotation.xy = float(x), float(y)
 
         # In case it's been hidden earlier...
         annotation.set_visible(True)
 
         if self.keep_inside:
-            self._keep_annotation_inside(annotation)
+            self._timed('keep_inside', self._keep_annotation_inside,
+                        annotation)
 
         annotation._has_been_shown = True
         self._last_event = event
         self._last_annotation = annotation
 
-        event.canvas.draw()
+        # With ``max_annotations``, the least recently updated annotation box
+        # is the one that's removed to make room for a new one. (Re-insert it
+        # at the end, as ``OrderedDict.move_to_end`` is python 3 only.)
+        key = self._annotation_keys.get(annotation)
+        if key is not None:
+            self.annotations[key] = self.annotations.pop(key)
+
+        self._redraw(event.canvas.figure)
+
+    def _timed(self, stage, func, *args, **kwargs):
+        """Call *func*, recording how long it takes as *stage* in
+        ``self.stats`` (if enabled)."""
+        if self.stats is None:
+            return func(*args, **kwargs)
+        start = timer()
+        result = func(*args, **kwargs)
+        self.stats.record(stage, timer() - start)
+        return result
 
     def _keep_annotation_inside(self, anno):
         fig = anno.figure
-
-        # Need to draw the annotation to get the correct extent
-        try:
-            anno.draw(fig.canvas.renderer)
-        except (AttributeError, RuntimeError):
-            # Can't draw properly on OSX and NbAgg backends. Disable keep_inside
-            return
-        bbox = anno.get_window_extent()
+        bbox = self._annotation_extent(anno)
 
         inside = [fig.bbox.contains(*corner) for corner in bbox.corners()]
         if all(inside):
@@ -632,6 +1016,71 @@ class DataCursor(object):
 
         self._adjust_alignment(anno)
 
+    def _annotation_extent(self, anno):
+        """The display extent of an annotation's text box, measured from its
+        text and font properties instead of drawing it."""
+        dpi = anno.figure.dpi
+        x, y = anno.axes.transData.transform(anno.xy)
+        try:
+            dx, dy = anno.xyann
+        except AttributeError:
+            dx, dy = anno.xytext
+        x, y = x + dx * dpi / 72.0, y + dy * dpi / 72.0
+
+        # Older versions of mpl always parse mathtext.
+        math = getattr(anno, 'get_parse_math', lambda: True)()
+        try:
+            linespacing = anno.get_linespacing()
+        except AttributeError:
+            # ...and don't have get_linespacing.
+            linespacing = anno._linespacing
+        x0, y0, x1, y1 = text_metrics.text_extent(anno.get_text(),
+                anno.get_fontproperties(), dpi, x, y,
+                anno.get_horizontalalignment(), anno.get_verticalalignment(),
+                linespacing, math)
+
+        # Add the padding of the box around the text.
+        patch = anno.get_bbox_patch()
+        if patch is not None:
+            fontsize = anno.get_fontproperties().get_size_in_points()
+            pad = getattr(patch.get_boxstyle(), 'pad', 0) * fontsize
+            pad *= dpi / 72.0
+            x0, y0, x1, y1 = x0 - pad, y0 - pad, x1 + pad, y1 + pad
+        return Bbox.from_extents(x0, y0, x1, y1)
+
+    def _redraw(self, fig):
+        """Redraw *fig* after annotations have been changed. While a figure's
+        dispatcher is handling an event, this is deferred so that the figure is
+        only redrawn once for all of its datacursors."""
+        if self._deferred_redraws is not None:
+            self._deferred_redraws.setdefault(fig, []).append(self)
+            return
+        self._timed('redraw', _FigureDispatcher.for_figure(fig).redraw,
+                    [self])
+
+    def _blit_artists(self, fig):
+        """The artists in *fig* that are redrawn when blitting."""
+        if fig in self._pinned_layers:
+            return [self._pinned_layers[fig]]
+        return [anno for anno in self.annotations.values()
+                if anno.figure is fig]
+
+    def _draw_animated(self, fig):
+        for artist in self._blit_artists(fig):
+            if artist.get_visible():
+                fig.draw_artist(artist)
+
+    def _can_blit(self, fig):
+        try:
+            return fig.canvas.supports_blit
+        except AttributeError:
+            # Older versions of mpl
+            return hasattr(fig.canvas, 'copy_from_bbox')
+
+    def _on_lims_changed(self, ax):
+        # Zooming or panning. The cached background is no longer valid.
+        _FigureDispatcher.for_figure(ax.figure).background = None
+
     def _on_keypress(self, event):
         if event.key == self.keybindings['hide']:
             if self._hidden:
@@ -672,10 +1121,11 @@ class DataCursor(object):
             self.update(event, self._last_annotation)
 
     def _select(self, event):
-        """This is basically a proxy to trigger a pick event.  This function is
-        connected to either a mouse motion or mouse button event (see
-        "self.enable") depending on "self.hover". If we're over a point, it
-        fires a pick event.
+        """This is basically a proxy to trigger a pick event for a mouse event
+        (motion or button press, depending on "self.hover"). If we're over a
+        point, it fires a pick event. This handles the event for this
+        datacursor alone. Normally, the figure's ``_FigureDispatcher`` handles
+        each mouse event for all of the datacursors in a figure at once.
 
         This probably seems bizarre, but it's required for hover mode (no mouse
         click) and otherwise it's a workaround for picking artists in twinned
@@ -685,54 +1135,724 @@ class DataCursor(object):
         twinned axes.  Therefore, we manually go through all artists managed by
         this datacursor and fire a pick event if the mouse is over an a managed
         artist."""
-        def event_axes_data(event, ax):
-            """Creates a new event will have xdata and ydata based on *ax*."""
-            # We need to redefine event.xdata and event.ydata for twinned axes
-            # to work correctly
-            point = event.x, event.y
-            x, y = ax.transData.inverted().transform_point(point)
-            event = copy.copy(event)
-            event.xdata, event.ydata = x, y
-            return event
-
-        def contains(artist, event):
-            """Need to ensure we don't trigger a pick event for axes in a
-            different figure. Otherwise, picking on one figure will trigger a
-            datacursor in another figure."""
-            if event.canvas is artist.figure.canvas:
-                return artist.contains(event)
-            else:
-                return False, {}
+        dispatcher = _FigureDispatcher.for_figure(event.canvas.figure)
+        dispatcher.dispatch(event, [self])
 
-        # If we're on top of an annotation box, hide it if right-clicked or
-        # do nothing if we're in draggable mode
+    def _check_annotations(self, event, fixed_events):
+        """
+        If we're on top of an annotation box, hide it if right-clicked. Returns
+        whether or not the mouse is over an annotation box, or None if the
+        event shouldn't be processed further (over a draggable box).
+        """
+        over_something = False
         for anno in list(self.annotations.values()):
-            fixed_event = event_axes_data(event, anno.axes)
-            if contains(anno, fixed_event)[0]:
+            # Don't trigger a datacursor for an annotation in another figure.
+            if event.canvas is not anno.figure.canvas:
+                continue
+            fixed_event = self._event_axes_data(event, anno.axes, fixed_events)
+            if anno.contains(fixed_event)[0]:
+                over_something = True
                 if event.button == self.hide_button:
                     self._hide_box(anno)
                 elif self.draggable:
-                    return
+                    return None
+        return over_something
+
+    def _handle_pick(self, event, new_event, over_something):
+        """Show the annotation for *new_event* (the PickEvent for the mouse
+        *event*, or None if it wasn't over any artist)."""
+        if new_event is not None:
+            over_something = True
+            if self.stats is not None:
+                self.stats.increment('picks')
+            self(new_event)
+
+        # Only hide (and redraw) when the mouse moves off of everything, not
+        # on every motion event while it's not over anything.
+        if self.hover:
+            if over_something:
+                self._hovering = True
+            elif self._hovering:
+                self._hovering = False
+                self.hide()
 
-        for artist in self.artists:
-            fixed_event = event_axes_data(event, artist.axes)
-            inside, info = contains(artist, fixed_event)
+    def _quadmesh_hit(self, artist, event):
+        """
+        Hit-test a QuadMesh by looking up the cell under the mouse instead of
+        testing every cell's path (which is what ``QuadMesh.contains`` does).
+        Returns the same (inside, info) tuple as ``artist.contains``.
+        """
+        if not artist.get_visible():
+            return False, {}
+        cell = pick_info.quadmesh_cell(artist, event.x, event.y)
+        if cell is None:
+            return False, {}
+        i, j = cell
+        ncols = pick_info._quadmesh_grid(artist)['x'].shape[1] - 1
+        return True, dict(ind=[i * ncols + j])
+
+    def _contour_hit(self, artist, event):
+        """
+        Hit-test one band of a filled contour set by finding the polygon the
+        mouse is inside of. Returns the same (inside, info) tuple as
+        ``artist.contains``.
+        """
+        if not artist.get_visible():
+            return False, {}
+        cs = self._contour_sets[artist]
+        hit = pick_info.contour_polygon(cs, event.x, event.y)
+        if hit is None or cs.collections[hit[0]] is not artist:
+            return False, {}
+        return True, dict(ind=[hit[1]])
+
+    def _event_axes_data(self, event, ax, fixed_events):
+        """Creates a new event will have xdata and ydata based on *ax*."""
+        # We need to redefine event.xdata and event.ydata for twinned axes
+        # to work correctly. Only do this once per axes per mouse event.
+        # (``inaxes`` is also set, as some artists' ``contains`` check it.)
+        if ax not in fixed_events:
+            point = event.x, event.y
+            x, y = ax.transData.inverted().transform_point(point)
+            fixed = copy.copy(event)
+            fixed.xdata, fixed.ydata, fixed.inaxes = x, y, ax
+            fixed_events[ax] = fixed
+        return fixed_events[ax]
+
+    def _hit_test(self, artist, event, hits):
+        """
+        Hit-test a single artist for a mouse *event* (with xdata and ydata for
+        the artist's axes). *hits* are the results of ``self._index_hits`` for
+        the artist's axes. Returns the same (inside, info) tuple as
+        ``artist.contains``.
+        """
+        if artist in hits:
+            return len(hits[artist]) > 0, dict(ind=hits[artist])
+        elif artist in self._contour_sets:
+            return self._contour_hit(artist, event)
+        elif isinstance(artist, QuadMesh):
+            return self._quadmesh_hit(artist, event)
+        else:
+            return artist.contains(event)
+
+    def query(self, x, y, coords='data', ax=None, text=True):
+        """
+        Get the information that would be displayed for many points at once,
+        without mouse events or drawing anything. This is useful for
+        regression tests and reports.
+
+        Lines, scatter plots, images and rectilinear ``QuadMesh``'s are
+        hit-tested, and their pick info is computed, for all of the points at
+        once (see ``pick_info.array_props``). Other artists go through the
+        same hit-testing and pick info functions as interactive picks, one
+        point at a time.
+
+        Parameters
+        -----------
+        x, y : arrays
+            The coordinates of the points to query.
+        coords : {'data', 'display'}, optional
+            Whether x & y are in the data coordinates of *ax* or in display
+            (pixel) coordinates. Defaults to 'data'.
+        ax : Axes, optional
+            The axes that data coordinates refer to. Only needed if this
+            datacursor manages artists in more than one axes. Only artists
+            in the figure of *ax* (or, if it isn't given, the first figure
+            this datacursor manages) are searched.
+        text : boolean, optional
+            Whether or not to call the formatter for each point. Defaults to
+            True.
+
+        Returns
+        --------
+        result : structured array
+            An array with the same shape as x & y with the fields:
+                `artist`: The index of the artist in ``self.artists`` (-1 if
+                    there's no artist at that point).
+                `ind`: The first index in the pick event (-1 if none).
+                `x`, `y`: The (possibly snapped) x & y values.
+                `z`: The z-value, if any (NaN otherwise).
+                `text`: The text that would be displayed (empty if no artist
+                    was found or *text* is False).
+
+        Notes
+        -----
+        The figure should have been drawn at least once so that the layout
+        (and the view of any 3D axes) is up to date. The formatter (and
+        *props_override*) are still called once per point that hits an
+        artist, and for artists handled all at once, the "ind" passed to
+        them only has the first index. Points on lines are interpolated near
+        that index, so they can differ slightly from interactive picks on
+        dense lines with sorted x-values.
+        """
+        x, y = np.broadcast_arrays(np.asarray(x, dtype=float),
+                                   np.asarray(y, dtype=float))
+        shape = x.shape
+        points = np.column_stack([x.ravel(), y.ravel()])
+        if coords == 'data':
+            if ax is None:
+                if len(self.axes) != 1:
+                    raise ValueError('"ax" must be specified for data '
+                                     'coordinates with more than one axes.')
+                ax = self.axes[0]
+            points = ax.transData.transform(points)
+        elif coords != 'display':
+            raise ValueError('"coords" must be either "data" or "display"')
+        fig = ax.figure if ax is not None else self.figures[0]
+
+        dtype = [('artist', int), ('ind', int), ('x', float), ('y', float),
+                 ('z', float), ('text', object)]
+        result = np.zeros(len(points), dtype=dtype)
+        result['artist'] = result['ind'] = -1
+        result['x'] = result['y'] = result['z'] = np.nan
+        result['text'] = ''
+
+        # Transform all points to the data coordinates of each axes at once
+        # and skip points that can't hit anything in each axes.
+        groups, data_coords, candidates = [], {}, {}
+        for ax, artists, clipped in self._artists_by_axes:
+            if ax.figure is not fig:
+                continue
+            groups.append((ax, artists))
+            data_coords[ax] = ax.transData.inverted().transform(points).T
+            if clipped:
+                pad = self.tolerance * ax.figure.dpi / 72.0
+                candidates[ax] = _bbox_contains(ax.bbox.padded(pad), points)
+            else:
+                candidates[ax] = np.ones(len(points), dtype=bool)
+
+        # Go through the artists in the same order as picking does. Each point
+        # is assigned to the first artist it hits.
+        remaining = np.ones(len(points), dtype=bool)
+        template = MouseEvent('motion_notify_event', fig.canvas, 0, 0)
+        found = []
+        for ax, artists in groups:
+            xdata, ydata = data_coords[ax]
+            index_rows, index_hits = None, None
+            for artist in artists:
+                rows = np.flatnonzero(remaining & candidates[ax])
+                if not rows.size:
+                    break
+
+                if (spatial_index.AxesIndex.supports(artist)
+                        and artist not in self.contour_levels):
+                    if index_hits is None:
+                        index_rows = rows
+                        index_hits = self._axes_index(ax).query_points(
+                            points[rows, 0], points[rows, 1])
+                    ind = index_hits[artist]
+                    hit = (ind >= 0) & remaining[index_rows]
+                    rows, ind = index_rows[hit], ind[hit]
+                elif isinstance(artist, AxesImage):
+                    hit = pick_info.image_hits(artist, xdata[rows],
+                                               ydata[rows])
+                    hit &= _bbox_contains(ax.bbox, points[rows])
+                    rows = rows[hit]
+                    ind = np.full(len(rows), -1, dtype=int)
+                elif isinstance(artist, QuadMesh):
+                    if not artist.get_visible():
+                        continue
+                    ind = pick_info.quadmesh_hits(artist, points[rows, 0],
+                                                  points[rows, 1])
+                    if ind is not None:
+                        rows, ind = rows[ind >= 0], ind[ind >= 0]
+                else:
+                    ind = None
+
+                if ind is None:
+                    # No vectorized hit-test (e.g. a curvilinear QuadMesh).
+                    found.append(self._query_each(artist, ax, rows, points,
+                                                  data_coords, template))
+                    remaining[found[-1][1]] = False
+                    continue
+
+                props = pick_info.array_props(artist, ind, xdata[rows],
+                                              ydata[rows])
+                found.append((artist, rows, ind, props, None))
+                remaining[rows] = False
+
+        artist_ids = dict((artist, i) for i, artist in enumerate(self.artists))
+        for artist, rows, ind, props, events in found:
+            result['artist'][rows] = artist_ids[artist]
+            result['ind'][rows] = ind
+            xdata, ydata = data_coords[artist.axes]
+            if (props is not None and self.props_override is None
+                    and not text):
+                # Nothing needs to be done for each point.
+                _fill(result['x'], rows, props.get('x', xdata[rows]))
+                _fill(result['y'], rows, props.get('y', ydata[rows]))
+                _fill(result['z'], rows, props.get('z'))
+                continue
+
+            for k, n in enumerate(rows):
+                if events is not None:
+                    info = self.event_info(events[k])
+                else:
+                    info = self._array_info(artist, template, points[n],
+                                            xdata[n], ydata[n], ind[k],
+                                            props, k)
+                if self.props_override is not None:
+                    info = self.props_override(**info)
+                row = result[n]
+                first = info.get('ind')
+                if first is not None and len(first):
+                    row['ind'] = first[0]
+                for key in ['x', 'y', 'z']:
+                    try:
+                        row[key] = info.get(key)
+                    except (TypeError, ValueError):
+                        pass
+                if text:
+                    row['text'] = self.formatter(**info)
+        return result.reshape(shape)
+
+    def _query_each(self, artist, ax, rows, points, data_coords, template):
+        """
+        Hit-test *artist* at each of the points *rows* of *points* with
+        ``self._hit_test`` (see ``self.query``). Returns the artist, the rows
+        of the points that hit it, the first index of each pick (-1 if
+        none), None, and the pick events.
+        """
+        hit_rows, ind, events = [], [], []
+        for n in rows:
+            event = copy.copy(template)
+            event.x, event.y = points[n]
+            fixed = copy.copy(event)
+            fixed.xdata = data_coords[ax][0][n]
+            fixed.ydata = data_coords[ax][1][n]
+            fixed.inaxes = ax
+            inside, info = self._hit_test(artist, fixed, {})
             if inside:
-                fig = artist.figure
-                new_event = PickEvent('pick_event', fig.canvas, fixed_event,
-                                     artist, **info)
-                self(new_event)
+                pick = PickEvent('pick_event', fixed.canvas, fixed, artist,
+                                 **info)
+                first = info.get('ind')
+                hit_rows.append(n)
+                ind.append(first[0] if first is not None and len(first)
+                           else -1)
+                events.append(pick)
+        return (artist, np.array(hit_rows, dtype=int),
+                np.array(ind, dtype=int), None, events)
+
+    def _array_info(self, artist, template, point, xdata, ydata, ind, props,
+                    k):
+        """
+        The info for a single point from ``self.query`` that ``event_info``
+        would return, taken from item *k* of the array *props* (or, if it's
+        None, from ``event_info``).
+        """
+        mouseevent = copy.copy(template)
+        mouseevent.x, mouseevent.y = point
+        mouseevent.xdata, mouseevent.ydata = xdata, ydata
+        mouseevent.inaxes = artist.axes
+        kwargs = {} if ind < 0 else dict(ind=[ind])
+        event = PickEvent('pick_event', mouseevent.canvas, mouseevent, artist,
+                          **kwargs)
+        if props is None:
+            return self.event_info(event)
+
+        info = dict(x=xdata, y=ydata, label=artist.get_label(), event=event)
+        info['ind'] = getattr(event, 'ind', None)
+        info['point_label'] = self._point_label(event)
+        for key, values in props.items():
+            info[key] = None if values is None else values[k]
+        return info
+
+    def _group_artists(self):
+        """
+        Group ``self.artists`` by axes (in the order that the axes first
+        appear) so that hit-testing can skip axes the mouse isn't over.
+        Returns a list of (axes, artists, clipped) tuples, where "clipped" is
+        True if all of the artists are clipped to the axes.
+        """
+        groups, lookup = [], {}
+        for artist in self.artists:
+            if artist.axes not in lookup:
+                lookup[artist.axes] = len(groups)
+                groups.append((artist.axes, []))
+            groups[lookup[artist.axes]][1].append(artist)
+        return [(ax, artists, all(art.get_clip_on() for art in artists))
+                for ax, artists in groups]
+
+    def _add_to_group(self, artist):
+        """Add a new artist to ``self._artists_by_axes``."""
+        for i, (ax, artists, clipped) in enumerate(self._artists_by_axes):
+            if ax is artist.axes:
+                artists.append(artist)
+                clipped = clipped and artist.get_clip_on()
+                self._artists_by_axes[i] = (ax, artists, clipped)
+                return
+        self._artists_by_axes.append((artist.axes, [artist],
+                                      artist.get_clip_on()))
+
+    def _axes_index(self, ax):
+        """Get (or create) the spatial index of the artists in *ax*."""
+        if ax not in self._indexes:
+            artists = [artist for artist in self.artists
+                       if artist.axes is ax
+                       and artist not in self.contour_levels]
+            self._indexes[ax] = spatial_index.AxesIndex(ax, artists,
+                                                        self.tolerance)
+        return self._indexes[ax]
+
+    def _index_hits(self, ax, event):
+        """
+        Hit-test the indexed artists in *ax* for a mouse event. Returns a dict
+        of artist: ind for every artist handled by a spatial index (see
+        ``self.use_index``). Artists that were not hit have an empty "ind".
+        Artists that are not in the dict must be hit-tested with "contains".
+        """
+        if not self.use_index:
+            return {}
 
-                # Only fire a single pick event for one mouseevent. Otherwise
-                # we'll need timers, etc to avoid multiple calls
-                break
+        index = self._axes_index(ax)
+        hits = dict((artist, []) for artist in index.artists)
+        hits.update(index.query(event.x, event.y))
+        return hits
+
+def _bbox_contains(bbox, points):
+    """Whether each of the Nx2 display-space *points* is inside *bbox*."""
+    return ((points[:, 0] >= bbox.x0) & (points[:, 0] <= bbox.x1)
+          & (points[:, 1] >= bbox.y0) & (points[:, 1] <= bbox.y1))
+
+def _fill(field, rows, values):
+    """Set *rows* of a float field of ``DataCursor.query``'s result to
+    *values*, skipping values that aren't numbers."""
+    if values is None:
+        return
+    try:
+        field[rows] = np.ma.filled(np.ma.asarray(values, dtype=float), np.nan)
+    except (TypeError, ValueError):
+        for n, value in zip(rows, values):
+            try:
+                field[n] = value
+            except (TypeError, ValueError):
+                pass
 
-        # Not hovering over anything...
-        if self.hover:
-            artists = itertools.chain(self.artists, self.annotations.values())
-            over_something = [contains(artist, event)[0] for artist in artists]
-            if not any(over_something):
-                self.hide()
+class _FigureDispatcher(object):
+    """
+    Handles the mouse and keyboard events of a figure for all of the
+    datacursors in it. Instead of every datacursor connecting its own
+    callbacks and hit-testing (and redrawing) independently, each mouse event
+    is hit-tested in a single pass over the artists of all datacursors (each
+    artist is tested once), routed to the datacursors that manage the artist
+    that was hit, and the figure is redrawn once afterwards. Key presses are
+    also handled with a single redraw. In blit mode, the dispatcher keeps one
+    background per figure, and the animated artists of every blitting
+    datacursor are drawn over it.
+    """
+    @classmethod
+    def for_figure(cls, fig):
+        """Get (or create) the dispatcher for the figure *fig*."""
+        dispatcher = getattr(fig, '_mpldatacursor_dispatcher', None)
+        if dispatcher is None:
+            dispatcher = cls(fig)
+            fig._mpldatacursor_dispatcher = dispatcher
+        return dispatcher
+
+    def __init__(self, fig):
+        self.figure = fig
+        # Enabled datacursors, in the order they were enabled, and the
+        # datacursors with keybindings (which stay connected when disabled).
+        self.cursors = []
+        self.key_cursors = []
+        # Artist: datacursors that manage it.
+        self._owners = {}
+        self._groups = None
+        self._cids = []
+        self._timer = None
+        self._timer_running = False
+        # Blitting datacursors (enabled or not) and the background they're
+        # all drawn over, captured before any of them is drawn.
+        self.blit_cursors = []
+        self.background = None
+        self._blit_cids = []
+
+    def add(self, cursor):
+        """Start dispatching mouse events to the datacursor *cursor*."""
+        if cursor in self.cursors:
+            return
+        self.cursors.append(cursor)
+        for artist in cursor.artists:
+            self._owners.setdefault(artist, []).append(cursor)
+        self._groups = None
+        self._connect()
+
+    def remove(self, cursor):
+        """Stop dispatching mouse events to the datacursor *cursor*."""
+        if cursor not in self.cursors:
+            return
+        self.cursors.remove(cursor)
+        for artist in cursor.artists:
+            owners = self._owners.get(artist, [])
+            if cursor in owners:
+                owners.remove(cursor)
+            if not owners:
+                self._owners.pop(artist, None)
+        self._groups = None
+
+    def add_artists(self, cursor, artists):
+        """Dispatch mouse events over *artists* to the datacursor *cursor*
+        (if it's enabled)."""
+        if cursor not in self.cursors:
+            return
+        for artist in artists:
+            if artist.figure is not self.figure:
+                continue
+            owners = self._owners.setdefault(artist, [])
+            if cursor not in owners:
+                owners.append(cursor)
+        self._groups = None
+
+    def remove_artists(self, cursor, artists):
+        """Stop dispatching mouse events over *artists* to *cursor*."""
+        for artist in artists:
+            owners = self._owners.get(artist, [])
+            if cursor in owners:
+                owners.remove(cursor)
+            if not owners:
+                self._owners.pop(artist, None)
+        self._groups = None
+
+    def add_keys(self, cursor):
+        """Dispatch key press events to the datacursor *cursor*."""
+        if cursor not in self.key_cursors:
+            self.key_cursors.append(cursor)
+        self._connect()
+
+    def add_blit(self, cursor):
+        """Draw the animated artists of the blitting datacursor *cursor* over
+        the figure's cached background."""
+        if cursor not in self.blit_cursors:
+            self.blit_cursors.append(cursor)
+        if not self._blit_cids:
+            canvas = self.figure.canvas
+            self._blit_cids = [
+                canvas.mpl_connect('draw_event', self._on_draw),
+                canvas.mpl_connect('resize_event', self._on_resize)]
+
+    def _on_draw(self, event):
+        """Cache the background after a full draw (which leaves out animated
+        artists), then draw the animated artists of every datacursor."""
+        if not self.blit_cursors[0]._can_blit(self.figure):
+            return
+        self.background = self.figure.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_animated()
+
+    def _on_resize(self, event):
+        self.background = None
+
+    def _draw_animated(self):
+        for cursor in self.blit_cursors:
+            cursor._draw_animated(self.figure)
+
+    def _connect(self):
+        if self._cids:
+            return
+        canvas = self.figure.canvas
+        self._cids = [
+            canvas.mpl_connect('button_press_event', self._on_button_press),
+            canvas.mpl_connect('motion_notify_event', self._on_motion),
+            canvas.mpl_connect('key_press_event', self._on_keypress)]
+
+    def _on_keypress(self, event):
+        """Handle a key press for every datacursor with keybindings, with a
+        single redraw afterwards (as for mouse events)."""
+        cursors = list(self.key_cursors)
+        self._batched(cursors, self._handle_keypress, event, cursors)
+
+    def _handle_keypress(self, event, cursors):
+        for cursor in cursors:
+            cursor._on_keypress(event)
+
+    def _on_button_press(self, event):
+        cursors = [cursor for cursor in self.cursors if not cursor.hover]
+        if cursors:
+            self.dispatch(event, cursors)
+
+    def _on_motion(self, event):
+        """
+        Coalesce and rate-limit mouse motion events for the datacursors in
+        hover mode. Each datacursor's ``hover_threshold`` and
+        ``max_hover_rate`` apply, but the datacursors that are due to be
+        updated at the same time share the hit-testing and redraw.
+        """
+        accepted = [cursor._accept_motion(event) for cursor in self.cursors
+                    if cursor.hover]
+        if any(accepted):
+            self._flush_motion()
+
+    def _flush_motion(self):
+        """Process the pending motion events of the datacursors that are due
+        and schedule a timer for the rest."""
+        self._timer_running = False
+        now = time.time()
+        due, wait = [], None
+        for cursor in self.cursors:
+            if not cursor.hover or cursor._pending_motion is None:
+                continue
+            remaining = cursor._motion_wait(now)
+            if remaining <= 0:
+                due.append(cursor)
+            elif wait is None or remaining < wait:
+                wait = remaining
+
+        # Datacursors with different thresholds may have different pending
+        # events. Datacursors with the same event are handled together.
+        while due:
+            event = due[0]._pending_motion
+            group = [cursor for cursor in due
+                     if cursor._pending_motion is event]
+            for cursor in group:
+                cursor._pending_motion = None
+                cursor._last_motion_xy = event.x, event.y
+                cursor._last_motion_time = now
+            due = [cursor for cursor in due if cursor not in group]
+            self.dispatch(event, group)
+
+        if wait is not None and not self._timer_running:
+            if self._timer is None:
+                self._timer = self.figure.canvas.new_timer()
+                self._timer.single_shot = True
+                self._timer.add_callback(self._flush_motion)
+            self._timer.interval = int(1000 * wait) + 1
+            self._timer_running = True
+            self._timer.start()
+
+    def dispatch(self, event, cursors):
+        """Handle the mouse *event* for the datacursors *cursors*."""
+        start = timer()
+        self._batched(cursors, self._handle, event, cursors)
+        self._record(cursors, 'total', timer() - start)
+
+    def _handle(self, event, cursors):
+        fixed_events = {}
+        active, over = [], {}
+        for cursor in cursors:
+            over_something = cursor._check_annotations(event, fixed_events)
+            if over_something is not None:
+                active.append(cursor)
+                over[cursor] = over_something
+
+        hit_start = timer()
+        picks = self._pick(event, active, fixed_events)
+        self._record(active, 'hit_test', timer() - hit_start)
+
+        for cursor in active:
+            cursor._handle_pick(event, picks.get(cursor), over[cursor])
+
+    def _batched(self, cursors, func, *args):
+        """
+        Call *func* with the redraws of the datacursors *cursors* deferred,
+        then redraw each figure that needs it once for all of them.
+        """
+        redraws = {}
+        for cursor in cursors:
+            cursor._deferred_redraws = redraws
+        try:
+            func(*args)
+        finally:
+            for cursor in cursors:
+                cursor._deferred_redraws = None
+
+        for fig, requesters in redraws.items():
+            redraw_start = timer()
+            _FigureDispatcher.for_figure(fig).redraw(requesters)
+            self._record(requesters, 'redraw', timer() - redraw_start)
+
+    def _record(self, cursors, stage, seconds):
+        for cursor in set(cursors):
+            if cursor.stats is not None:
+                cursor.stats.record(stage, seconds)
+
+    def _artist_groups(self):
+        """
+        The artists of all enabled datacursors in this figure, grouped by axes
+        (see ``DataCursor._group_artists``). Returns a list of (axes, artists,
+        pad) tuples, where "pad" is the distance (in pixels) outside of the
+        axes that the mouse can be and still be over something, or None if
+        some of the artists aren't clipped to the axes.
+        """
+        if self._groups is not None:
+            return self._groups
+        groups, lookup, seen = [], {}, set()
+        for cursor in self.cursors:
+            pad = cursor.tolerance * self.figure.dpi / 72.0
+            for ax, artists, clipped in cursor._artists_by_axes:
+                if ax.figure is not self.figure:
+                    continue
+                if ax not in lookup:
+                    lookup[ax] = len(groups)
+                    groups.append([ax, [], pad])
+                group = groups[lookup[ax]]
+                if not clipped:
+                    group[2] = None
+                elif group[2] is not None:
+                    group[2] = max(group[2], pad)
+                for artist in artists:
+                    if artist not in seen:
+                        seen.add(artist)
+                        group[1].append(artist)
+        self._groups = [tuple(group) for group in groups]
+        return self._groups
+
+    def _pick(self, event, cursors, fixed_events):
+        """
+        Find the artist under the mouse for each of the datacursors
+        *cursors*. Each artist is hit-tested at most once (by the first
+        datacursor that manages it), and a hit is routed to all of the
+        datacursors that manage the artist. Returns a dict of
+        datacursor: PickEvent.
+        """
+        picks = {}
+        wanted = set(cursors)
+        if not wanted:
+            return picks
+        for ax, artists, pad in self._artist_groups():
+            if pad is not None:
+                if not ax.bbox.padded(pad).contains(event.x, event.y):
+                    continue
+
+            fixed_event, hits = None, {}
+            for artist in artists:
+                owners = [cursor for cursor in self._owners.get(artist, [])
+                          if cursor in wanted and cursor not in picks]
+                if not owners:
+                    continue
+                cursor = owners[0]
+                if fixed_event is None:
+                    fixed_event = cursor._event_axes_data(event, ax,
+                                                          fixed_events)
+                if cursor not in hits:
+                    hits[cursor] = cursor._index_hits(ax, event)
+                inside, info = cursor._hit_test(artist, fixed_event,
+                                                hits[cursor])
+                if inside:
+                    for owner in owners:
+                        picks[owner] = PickEvent('pick_event', event.canvas,
+                                                 fixed_event, artist, **info)
+                    if len(picks) == len(wanted):
+                        return picks
+        return picks
+
+    def redraw(self, requesters):
+        """
+        Redraw the figure once for all of the datacursors *requesters*. If
+        they're all blitting, the animated artists of every blitting
+        datacursor in the figure are redrawn over the cached background.
+        """
+        fig = self.figure
+        if not all(cursor.blit for cursor in requesters):
+            fig.canvas.draw()
+            return
+
+        if self.background is None:
+            # Not drawn yet, invalidated, or blitting isn't supported. The
+            # background will be (re)cached when the draw happens.
+            fig.canvas.draw_idle()
+            return
+
+        fig.canvas.restore_region(self.background)
+        self._draw_animated()
+        fig.canvas.blit(fig.bbox)
 
 class HighlightingDataCursor(DataCursor):
     """A data cursor that highlights the selected Line2D artist."""
@@ -782,9 +1902,27 @@ class HighlightingDataCursor(DataCursor):
         highlight = copy.copy(artist)
         highlight.set(color=self.highlight_color, mec=self.highlight_color,
                       lw=self.highlight_width, mew=self.highlight_width)
+        if self.blit and self._can_blit(artist.figure):
+            highlight.set_animated(True)
+        # Don't let ``auto_add`` pick up the highlight as a new artist.
+        highlight._mpldatacursor_ignore = True
         artist.axes.add_artist(highlight)
         return highlight
 
+    def remove_artists(self, artists):
+        DataCursor.remove_artists(self, artists)
+        for artist in list(self.highlights):
+            if artist not in self._artist_set:
+                highlight = self.highlights.pop(artist)
+                if highlight.axes is not None:
+                    highlight.remove()
+        return self
+
+    def _blit_artists(self, fig):
+        artists = DataCursor._blit_artists(self, fig)
+        return artists + [highlight for highlight in self.highlights.values()
+                          if highlight.figure is fig]
+
 # Workaround for bug in matplotlib 1.4.x series
 if matplotlib.__version__.startswith('1.4'):
     DataCursor.default_annotation_kwargs['bbox']['alpha'] = 1
@@ -21,7 +21,18 @@ SOFTWARE.
 """
 import numpy as np
 import matplotlib.transforms as mtransforms
+from matplotlib.path import Path
+from matplotlib.image import AxesImage
+from matplotlib.collections import PathCollection, LineCollection
+from matplotlib.collections import PatchCollection, PolyCollection, QuadMesh
+from matplotlib.lines import Line2D
+from matplotlib.patches import Rectangle
 from mpl_toolkits import mplot3d
+from mpl_toolkits.mplot3d import art3d
+
+# Lines with more vertices than this aren't transformed to display space in
+# their entirety. Only the vertices near a pick are.
+large_line_size = 100000
 
 #-- Artist-specific pick info functions --------------------------------------
 
@@ -44,19 +55,45 @@ def _coords2index(im, x, y, inverted=False):
     Returns
     --------
     i, j : Index coordinates of the array associated with the image.
+
+    Notes
+    -----
+    The transform is cached on the image and is only rebuilt when the image's
+    extent, origin, or array shape change.
     """
-    xmin, xmax, ymin, ymax = im.get_extent()
-    if im.origin == 'upper':
-        ymin, ymax = ymax, ymin
-    data_extent = mtransforms.Bbox([[ymin, xmin], [ymax, xmax]])
-    array_extent = mtransforms.Bbox([[0, 0], im.get_array().shape[:2]])
-    trans = mtransforms.BboxTransformFrom(data_extent) +\
-            mtransforms.BboxTransformTo(array_extent)
+    trans = _index_transform(im, inverted)
+    return trans.transform_point([y,x]).astype(int)
 
-    if inverted:
-        trans = trans.inverted()
+def _index_transform(im, inverted=False):
+    """The (cached) transform from data coordinates (as y, x) to index
+    coordinates of an image's array (or the inverse). See
+    ``_coords2index``."""
+    shape = _image_array(im).shape[:2]
+    key = (tuple(im.get_extent()), im.origin, shape)
+    cache = getattr(im, '_mpldatacursor_index_transform', None)
+    if cache is None or cache[0] != key:
+        xmin, xmax, ymin, ymax = key[0]
+        if im.origin == 'upper':
+            ymin, ymax = ymax, ymin
+        data_extent = mtransforms.Bbox([[ymin, xmin], [ymax, xmax]])
+        array_extent = mtransforms.Bbox([[0, 0], shape])
+        trans = mtransforms.BboxTransformFrom(data_extent) +\
+                mtransforms.BboxTransformTo(array_extent)
+        trans = trans.frozen()
+        cache = (key, trans, trans.inverted())
+        im._mpldatacursor_index_transform = cache
+    return cache[2] if inverted else cache[1]
 
-    return trans.transform_point([y,x]).astype(int)
+def _image_array(im):
+    """
+    The array to look up values of an image in. This is the source array
+    given to the DataCursor for *im* (see the ``source_data`` kwarg), if
+    any, and the image's array otherwise.
+    """
+    source = getattr(im, '_mpldatacursor_source', None)
+    if source is None:
+        source = im.get_array()
+    return source
 
 def image_props(event):
     """
@@ -76,8 +113,14 @@ def image_props(event):
     """
     x, y = event.mouseevent.xdata, event.mouseevent.ydata
     i, j = _coords2index(event.artist, x, y)
-    z = event.artist.get_array()[i,j]
-    if z.size > 1:
+
+    # Only read the one element we need. If the array is a memmap or is
+    # otherwise lazily loaded, this avoids reading the rest of it.
+    arr = _image_array(event.artist)
+    nrows, ncols = arr.shape[:2]
+    i, j = min(max(i, 0), nrows - 1), min(max(j, 0), ncols - 1)
+    z = arr[i, j]
+    if np.size(z) > 1:
         # Override default numpy formatting for this specific case. Bad idea?
         z = ', '.join('{:0.3g}'.format(item) for item in z)
     return dict(z=z, i=i, j=j)
@@ -103,79 +146,248 @@ def line_props(event):
     """
     xclick, yclick = event.mouseevent.xdata, event.mouseevent.ydata
     i = event.ind[0]
-    xorig, yorig = event.artist.get_xydata().T
 
     # For points-only lines, snap to the nearest point.
     linestyle = event.artist.get_linestyle()
     if linestyle in ['none', ' ', '', None, 'None']:
+        xorig, yorig = event.artist.get_xydata().T
         return dict(x=xorig[i], y=yorig[i])
 
-    # ax.step is actually implemented as a Line2D with a different drawstyle...
-    xs_data = xorig[max(i - 1, 0) : i + 2]
-    ys_data = yorig[max(i - 1, 0) : i + 2]
-    drawstyle = event.artist.drawStyles[event.artist.get_drawstyle()]
-    if drawstyle == "_draw_lines":
-        pass
-    elif drawstyle == "_draw_steps_pre":
-        xs_data = _interleave(xs_data, xs_data[:-1])
-        ys_data = _interleave(ys_data, ys_data[1:])
-    elif drawstyle == "_draw_steps_post":
-        xs_data = _interleave(xs_data, xs_data[1:])
-        ys_data = _interleave(ys_data, ys_data[:-1])
-    elif drawstyle == "_draw_steps_mid":
-        mid_xs = (xs_data[:-1] + xs_data[1:]) / 2
-        xs_data = _interleave(xs_data, np.column_stack([mid_xs, mid_xs]))
-        ys_data = _interleave(
-            ys_data, np.column_stack([ys_data[:-1], ys_data[1:]]))
+    # ax.step is actually implemented as a Line2D with a different drawstyle,
+    # so work with the vertices as drawn. Only look at the segments near
+    # vertex i (or, for monotonic x, near the click).
+    window = _sorted_window(event, i)
+    if window is not None:
+        xs_screen, ys_screen = window.T
+    elif len(event.artist.get_xydata()) > large_line_size:
+        xs_screen, ys_screen = _line_window(event.artist, i).T
     else:
-        raise ValueError(
-            "Unknown drawstyle: {}".format(event.artist.get_drawstyle()))
+        geometry = _line_geometry(event.artist)
+        step = geometry['step']
+        xs_screen, ys_screen = geometry['screen'][max(step * (i - 1), 0):
+                                                  step * (i + 2)].T
+
     # The artist transform may be different from the axes transform (e.g.,
     # axvline/axhline)
-    artist_transform = event.artist.get_transform()
     axes_transform = event.artist.axes.transData
-    xs_screen, ys_screen = (
-        artist_transform.transform(
-            np.column_stack([xs_data, ys_data]))).T
     xclick_screen, yclick_screen = (
         axes_transform.transform([xclick, yclick]))
-    x_screen, y_screen = _interpolate_line(xs_screen, ys_screen,
-                                           xclick_screen, yclick_screen)
+    x_screen, y_screen, _, _ = _interpolate_line(xs_screen, ys_screen,
+                                                 xclick_screen, yclick_screen)
     x, y = axes_transform.inverted().transform([x_screen, y_screen])
 
     return dict(x=x, y=y)
 
-def _interleave(a, b):
-    """Interleave arrays a and b; b may have multiple columns and must be
-    shorter by 1.
+def _sorted_window(event, i):
+    """
+    For lines with monotonically increasing x-values, get the display-space
+    vertices (as drawn) of every segment that could be within the pick radius
+    of the click, as well as the neighbors of vertex *i*. This finds the
+    segments with ``np.searchsorted`` instead of relying only on the neighbors
+    of the first vertex hit. Returns None if the line isn't sorted (or isn't
+    drawn in data coordinates).
+
+    Note that dates are just numbers (see ``matplotlib.dates``) as far as
+    this is concerned.
+    """
+    artist = event.artist
+    if artist.get_transform() is not artist.axes.transData:
+        return None
+    if not _sorted_x(artist):
+        return None
+
+    try:
+        radius = artist.get_pickradius()
+    except AttributeError:
+        # Older versions of mpl
+        radius = artist.pickradius
+    pixels = radius * artist.figure.dpi / 72.0
+    transform = artist.get_transform()
+    xclick, yclick = transform.transform(
+        [event.mouseevent.xdata, event.mouseevent.ydata])
+    xmin, xmax = np.sort(transform.inverted().transform(
+        [[xclick - pixels, yclick], [xclick + pixels, yclick]])[:, 0])
+
+    xy = artist.get_xydata()
+    lo, hi = _segment_range(xy[:, 0], xmin, xmax)
+    lo, hi = min(lo, max(i - 1, 0)), max(hi, i + 1)
+    window = np.asarray(xy[lo : hi + 1], dtype=float)
+    drawstyle = artist.drawStyles[artist.get_drawstyle()]
+    x, y = _step_vertices(window[:, 0], window[:, 1], drawstyle)
+    return transform.transform(np.column_stack([x, y]))
+
+def _sorted_x(artist):
+    """
+    Whether or not the x-values of a Line2D artist are monotonically
+    increasing (e.g. a time series). This is checked once per data array and
+    cached on the artist. Lines containing NaNs are never considered sorted.
+    """
+    data = artist.get_xydata()
+    cache = getattr(artist, '_mpldatacursor_sorted', None)
+    if cache is None or cache[0] is not data:
+        x = np.asarray(data[:, 0])
+        cache = (data, len(x) > 1 and bool(np.all(x[1:] >= x[:-1])))
+        artist._mpldatacursor_sorted = cache
+    return cache[1]
+
+def _segment_range(x, xmin, xmax):
+    """
+    For sorted *x*, find the segments (i.e. the vertex each starts at) that
+    overlap the range *xmin* to *xmax* in O(log n). Returns the start and
+    (exclusive) stop of the range of segment indices.
+    """
+    lo = max(np.searchsorted(x, xmin, 'left') - 1, 0)
+    hi = min(np.searchsorted(x, xmax, 'right'), len(x) - 1)
+    return lo, hi
+
+def _line_window(artist, i):
+    """Display-space vertices (as drawn) of *artist* near data point *i*,
+    without transforming the rest of the line."""
+    window = np.asarray(artist.get_xydata()[max(i - 1, 0) : i + 2],
+                        dtype=float)
+    drawstyle = artist.drawStyles[artist.get_drawstyle()]
+    x, y = _step_vertices(window[:, 0], window[:, 1], drawstyle)
+    return artist.get_transform().transform(np.column_stack([x, y]))
+
+def _line_geometry(artist):
+    """
+    Get the display-space vertices of a Line2D artist, cached on the artist.
+
+    The cache is reused until the artist's data, drawstyle, or transform
+    change, including changes to the view limits, axes position, figure size
+    or dpi, and axis scales. (Matplotlib's transforms already track these, so
+    comparing the current affine matrix is enough to detect them.) Note that
+    in-place modification of the artist's data array will not be detected.
+
+    Parameters
+    -----------
+    artist : Line2D
+        The line to get the vertices of.
+
+    Returns
+    --------
+    geometry : dict
+        A dict with keys:
+            `points` : An Nx2 array of the data points in display space.
+            `screen` : An Mx2 array of the vertices as drawn in display
+                space. For step drawstyles, this includes the vertices of the
+                steps.
+            `step` : The number of drawn vertices per data point. 1 for
+                normal lines and 2 for step drawstyles.
     """
-    b = np.column_stack([b]) # Turn b into a column array.
-    nx, ny = b.shape
-    c = np.zeros((nx + 1, ny + 1))
-    c[:, 0] = a
-    c[:-1, 1:] = b
-    return c.ravel()[:-(c.shape[1] - 1)]
+    data = artist.get_xydata()
+    drawstyle = artist.drawStyles[artist.get_drawstyle()]
+    transform = artist.get_transform()
+    key = [drawstyle, transform.get_affine().get_matrix()]
+    if artist.axes is not None:
+        key += [artist.axes.get_xscale(), artist.axes.get_yscale()]
+
+    cache = getattr(artist, '_mpldatacursor_geometry', None)
+    if (cache is not None and cache['xy'] is data
+            and cache['transform'] is transform
+            and _same_key(cache['key'], key)):
+        return cache
+
+    xy = np.asarray(data, dtype=float)
+    points = transform.transform(xy)
+    if drawstyle == '_draw_lines' or len(xy) < 2:
+        screen = points
+    else:
+        x, y = _step_vertices(xy[:, 0], xy[:, 1], drawstyle)
+        screen = transform.transform(np.column_stack([x, y]))
+
+    # Note that the key holds a *copy* of the current affine matrix.
+    key[1] = key[1].copy()
+    cache = dict(xy=data, transform=transform, key=key,
+                 points=points, screen=screen,
+                 step=1 if drawstyle == '_draw_lines' else 2)
+    artist._mpldatacursor_geometry = cache
+    return cache
+
+def _same_key(key1, key2):
+    """Compare cache keys that may contain arrays."""
+    if len(key1) != len(key2):
+        return False
+    for item1, item2 in zip(key1, key2):
+        if isinstance(item1, np.ndarray):
+            if not np.array_equal(item1, item2):
+                return False
+        elif item1 != item2:
+            return False
+    return True
+
+def _step_vertices(x, y, drawstyle):
+    """Expand the vertices of a line into the vertices drawn for a step-style
+    *drawstyle* (one of ``Line2D.drawStyles.values()``)."""
+    if drawstyle == '_draw_lines' or len(x) < 2:
+        return x, y
+
+    n = 2 * len(x) - 1
+    if drawstyle == '_draw_steps_mid':
+        n += 1
+    xs, ys = np.empty(n), np.empty(n)
+    if drawstyle == '_draw_steps_pre':
+        xs[0::2], xs[1::2] = x, x[:-1]
+        ys[0::2], ys[1::2] = y, y[1:]
+    elif drawstyle == '_draw_steps_post':
+        xs[0::2], xs[1::2] = x, x[1:]
+        ys[0::2], ys[1::2] = y, y[:-1]
+    elif drawstyle == '_draw_steps_mid':
+        mid = (x[:-1] + x[1:]) / 2.0
+        xs[0], xs[-1] = x[0], x[-1]
+        xs[1:-1:2], xs[2:-1:2] = mid, mid
+        ys[0::2], ys[1::2] = y, y
+    else:
+        raise ValueError('Unknown drawstyle: {}'.format(drawstyle))
+    return xs, ys
 
 def _interpolate_line(xorig, yorig, xclick, yclick):
-    """Find the nearest point on a polyline segment to the point *xclick*
-    *yclick*."""
-    candidates = []
-    # The closest point may be a vertex.
-    for x, y in zip(xorig, yorig):
-        candidates.append((np.hypot(xclick - x, yclick - y), (x, y)))
-    # Or it may be a projection on a segment.
-    for (x0, x1), (y0, y1) in zip(zip(xorig, xorig[1:]), zip(yorig, yorig[1:])):
-        vec1 = np.array([x1 - x0, y1 - y0])
-        vec1 /= np.linalg.norm(vec1)
-        vec2 = np.array([xclick - x0, yclick - y0])
-        dist_along = vec1.dot(vec2)
-        x, y = np.array([x0, y0]) + dist_along * vec1
-        # Drop if out of the segment.
-        if (x - x0) * (x - x1) > 0 or (y - y0) * (y - y1) > 0:
-            continue
-        candidates.append((np.hypot(xclick - x, yclick - y), (x, y)))
-    _, (x, y) = min(candidates)
-    return x, y
+    """
+    Find the nearest point on a polyline to the point *xclick*, *yclick*.
+
+    Parameters
+    -----------
+    xorig, yorig : 1D arrays
+        The N vertices of the polyline.
+    xclick, yclick : numbers
+        The point to find the nearest point on the polyline to.
+
+    Returns
+    --------
+    x, y : numbers
+        The nearest point on the polyline.
+    i : int
+        The index of the segment (i.e. the vertex it starts at) containing
+        the nearest point.
+    t : number
+        The fractional position of the nearest point along segment *i*, from
+        0 (vertex *i*) to 1 (vertex *i + 1*).
+    """
+    xorig = np.asarray(xorig, dtype=float)
+    yorig = np.asarray(yorig, dtype=float)
+    if len(xorig) == 1:
+        return xorig[0], yorig[0], 0, 0.0
+
+    x, y, t, dist = _project_to_segments(xorig[:-1], yorig[:-1], xorig[1:],
+                                         yorig[1:], xclick, yclick)
+    i = np.argmin(np.where(np.isnan(dist), np.inf, dist))
+    return x[i], y[i], i, t[i]
+
+def _project_to_segments(x0, y0, x1, y1, x, y):
+    """
+    Vectorized projection of the point *x*, *y* onto each of the segments
+    from *x0*, *y0* to *x1*, *y1*, clamped to the ends of the segments.
+    Returns the projected points, their fractional positions along each
+    segment, and their distances from *x*, *y*.
+    """
+    dx, dy = x1 - x0, y1 - y0
+    length2 = dx**2 + dy**2
+    with np.errstate(invalid='ignore', divide='ignore'):
+        t = ((x - x0) * dx + (y - y0) * dy) / length2
+    # Zero-length segments project onto their (single) vertex.
+    t = np.where(length2 > 0, np.clip(t, 0, 1), 0)
+    xp, yp = x0 + t * dx, y0 + t * dy
+    return xp, yp, t, np.hypot(xp - x, yp - y)
 
 def collection_props(event):
     """
@@ -190,6 +402,386 @@ def collection_props(event):
         z = arr[ind]
     return dict(z=z, c=z)
 
+def quadmesh_props(event):
+    """
+    Get information for a pick event on a ``QuadMesh`` artist (usually
+    created with ``pcolormesh``).
+
+    Parameters
+    -----------
+    event : PickEvent
+        The pick event to process
+
+    Returns
+    --------
+    A dict with keys:
+        `i`, `j`: The row and column of the cell under the cursor.
+        `z`: The value of the mesh's array for that cell (identical to `c`).
+        `bounds`: The (xmin, xmax, ymin, ymax) extent of the cell.
+
+    Notes
+    -----
+    If the cell can't be found (e.g. the mouse is just outside the mesh), this
+    falls back to ``collection_props``.
+    """
+    mouse = event.mouseevent
+    cell = quadmesh_cell(event.artist, mouse.x, mouse.y)
+    if cell is None:
+        return collection_props(event)
+    i, j = cell
+
+    grid = _quadmesh_grid(event.artist)
+    quad = _quad_corners(grid, slice(i, i + 1), slice(j, j + 1))
+    xmin, xmax = quad[0].min(), quad[0].max()
+    ymin, ymax = quad[1].min(), quad[1].max()
+
+    z = None
+    arr = event.artist.get_array()
+    nrows, ncols = grid['x'].shape
+    if arr is not None and np.size(arr) > 1:
+        if np.size(arr) == nrows * ncols:
+            # Gouraud shading: values are given at the vertices. Report the
+            # value of the vertex nearest to the cursor.
+            x, y = _quadmesh_point(event.artist, mouse.x, mouse.y)
+            dist = np.hypot(quad[0].ravel() - x, quad[1].ravel() - y)
+            di, dj = [(0, 0), (0, 1), (1, 1), (1, 0)][dist.argmin()]
+            i, j = i + di, j + dj
+        else:
+            ncols -= 1
+        if np.ndim(arr) == 1:
+            z = arr[i * ncols + j]
+        else:
+            z = arr[i, j]
+        if np.size(z) > 1:
+            z = ', '.join('{:0.3g}'.format(item) for item in np.ravel(z))
+    return dict(i=i, j=j, z=z, c=z, bounds=(xmin, xmax, ymin, ymax))
+
+def quadmesh_cell(artist, x, y):
+    """
+    Find the cell of a ``QuadMesh`` containing a point.
+
+    Parameters
+    -----------
+    artist : QuadMesh
+        The mesh to search.
+    x, y : numbers
+        The point in display coordinates.
+
+    Returns
+    --------
+    i, j : The row and column of the cell containing the point, or None if
+        the point isn't inside the mesh.
+
+    Notes
+    -----
+    Whether the mesh is rectilinear is detected once. Rectilinear meshes are
+    searched with ``np.searchsorted``. Curvilinear meshes are split into
+    blocks of cells and only the cells of blocks whose bounding box contains
+    the point are tested.
+    """
+    grid = _quadmesh_grid(artist)
+    x, y = _quadmesh_point(artist, x, y)
+    if grid['last'][0] == (x, y):
+        return grid['last'][1]
+
+    if grid['xedges'] is not None:
+        j = _edge_index(grid['xedges'], x)
+        i = _edge_index(grid['yedges'], y)
+        cell = None if i is None or j is None else (i, j)
+    else:
+        cell = _curvilinear_cell(grid, x, y)
+
+    grid['last'] = ((x, y), cell)
+    return cell
+
+def _quadmesh_point(artist, x, y):
+    """Convert a point in display coordinates to the mesh's coordinates."""
+    return artist.get_transform().inverted().transform_point((x, y))
+
+def _quadmesh_grid(artist):
+    """
+    Get the (cached) cell lookup info for a ``QuadMesh``. Only rebuilt if the
+    mesh's coordinates change.
+    """
+    if hasattr(artist, 'get_coordinates'):
+        coords = artist.get_coordinates()
+    else:
+        coords = artist._coordinates
+    grid = getattr(artist, '_mpldatacursor_grid', None)
+    if grid is not None and grid['coords'] is coords:
+        return grid
+
+    x, y = np.asarray(coords[..., 0]), np.asarray(coords[..., 1])
+    grid = dict(coords=coords, x=x, y=y, xedges=None, yedges=None,
+                last=(None, None))
+    if np.all(x == x[:1, :]) and np.all(y == y[:, :1]):
+        xedges, yedges = x[0], y[:, 0]
+        if _is_monotonic(xedges) and _is_monotonic(yedges):
+            grid['xedges'], grid['yedges'] = xedges, yedges
+
+    if grid['xedges'] is None:
+        size = _quadmesh_block_size
+        grid['size'] = size
+        grid['blocks'] = [_block_reduce(x, size, np.minimum),
+                          _block_reduce(x, size, np.maximum),
+                          _block_reduce(y, size, np.minimum),
+                          _block_reduce(y, size, np.maximum)]
+
+    artist._mpldatacursor_grid = grid
+    return grid
+
+# Curvilinear meshes are indexed in blocks of this many cells on a side.
+_quadmesh_block_size = 32
+
+def _is_monotonic(edges):
+    """Whether a 1D array is strictly increasing or decreasing."""
+    diff = np.diff(edges)
+    return len(edges) > 1 and (np.all(diff > 0) or np.all(diff < 0))
+
+def _edge_index(edges, value):
+    """The index of the interval of the monotonic *edges* holding *value*."""
+    k = _edge_indices(edges, np.array([value], dtype=float))[0]
+    return None if k < 0 else int(k)
+
+def _edge_indices(edges, values):
+    """Vectorized ``_edge_index``. Returns -1 for values outside *edges*."""
+    ascending = edges[0] < edges[-1]
+    if not ascending:
+        edges = edges[::-1]
+    ncells = len(edges) - 1
+    k = np.minimum(np.searchsorted(edges, values, side='right') - 1,
+                   ncells - 1)
+    if not ascending:
+        k = ncells - 1 - k
+    with np.errstate(invalid='ignore'):
+        inside = (values >= edges[0]) & (values <= edges[-1])
+    return np.where(inside, k, -1)
+
+def _block_reduce(a, size, func):
+    """
+    Apply the ufunc *func* to blocks of *size* x *size* cells of a 2D array
+    of cell corners. Neighboring blocks share their edge corners.
+    """
+    for axis in [0, 1]:
+        ncells = a.shape[axis] - 1
+        starts = np.arange(0, ncells, size)
+        ends = np.minimum(starts + size, ncells)
+        a = func(func.reduceat(a, starts, axis=axis),
+                 np.take(a, ends, axis=axis))
+    return a
+
+def _quad_corners(grid, rows, cols):
+    """
+    The x and y corner coordinates (shape ``(2, nrows, ncols, 4)``) of the
+    cells in the slices *rows* and *cols*, in drawing order.
+    """
+    x = grid['x'][rows.start:rows.stop + 1, cols.start:cols.stop + 1]
+    y = grid['y'][rows.start:rows.stop + 1, cols.start:cols.stop + 1]
+    return np.array([np.dstack([c[:-1, :-1], c[:-1, 1:], c[1:, 1:], c[1:, :-1]])
+                     for c in [x, y]])
+
+def _curvilinear_cell(grid, x, y):
+    """Find the cell of a curvilinear mesh containing the point x, y."""
+    xmin, xmax, ymin, ymax = grid['blocks']
+    size = grid['size']
+    nrows, ncols = grid['x'].shape[0] - 1, grid['x'].shape[1] - 1
+    candidates = (xmin <= x) & (xmax >= x) & (ymin <= y) & (ymax >= y)
+    for bi, bj in zip(*np.nonzero(candidates)):
+        rows = slice(bi * size, min(bi * size + size, nrows))
+        cols = slice(bj * size, min(bj * size + size, ncols))
+        qx, qy = _quad_corners(grid, rows, cols)
+        hits = np.argwhere(_in_quads(qx, qy, x, y))
+        if len(hits):
+            i, j = hits[0]
+            return rows.start + i, cols.start + j
+    return None
+
+def _in_quads(qx, qy, x, y):
+    """Even-odd test of whether x, y is inside each of the quads qx, qy."""
+    inside = np.zeros(qx.shape[:-1], dtype=bool)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for k in range(4):
+            x0, y0 = qx[..., k], qy[..., k]
+            x1, y1 = qx[..., k - 1], qy[..., k - 1]
+            crosses = (y0 > y) != (y1 > y)
+            xcross = x0 + (y - y0) * (x1 - x0) / (y1 - y0)
+            inside ^= crosses & (x < xcross)
+    return inside
+
+def contour_polygon(cs, x, y):
+    """
+    Find the polygon of a filled ``ContourSet`` containing a point.
+
+    Parameters
+    -----------
+    cs : ContourSet
+        The filled contour set to search.
+    x, y : numbers
+        The point in display coordinates.
+
+    Returns
+    --------
+    k, n : The index of the collection (i.e. the band) and of the path within
+        that collection containing the point, or None if the point isn't
+        inside any of the contour set's polygons.
+    """
+    index = _contour_index(cs)
+    point = tuple(cs.collections[0].get_transform().inverted()
+                  .transform_point((x, y)))
+    if index['last'][0] == point:
+        return index['last'][1]
+
+    i = contour_polygons(index, [point])[0]
+    hit = None if i < 0 else (index['owner'][i], index['pathnum'][i])
+    index['last'] = (point, hit)
+    return hit
+
+def contour_polygons(index, points):
+    """
+    Find which paths of a filled contour set's index (see ``_contour_index``)
+    contain each of *points*, an Nx2 array in data coordinates. Returns an
+    array of indices into ``index['owner']`` and ``index['pathnum']``, with
+    -1 for points that aren't inside any path.
+
+    Only rings with a bounding box containing a point are tested, and each of
+    those is tested against all of the points inside its bounding box at once
+    with ``Path.contains_points``.
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    result = np.empty(len(points), dtype=int)
+    result.fill(-1)
+    if not len(points) or not len(index['rings']):
+        return result
+
+    # Bounding boxes are sorted by their left edge, so only the first few can
+    # possibly contain any of the points.
+    px, py = points.T
+    xmin, xmax, ymin, ymax = index['bounds']
+    stop = np.searchsorted(xmin, px.max(), side='right')
+    xmin, xmax = xmin[:stop, None], xmax[:stop, None]
+    ymin, ymax = ymin[:stop, None], ymax[:stop, None]
+    candidates = (xmin <= px) & (xmax >= px) & (ymin <= py) & (ymax >= py)
+
+    hits = []
+    for i in np.nonzero(candidates.any(axis=1))[0]:
+        which = np.nonzero(candidates[i])[0]
+        inside = index['rings'][i].contains_points(points[which])
+        hits.append(which[inside] * len(index['owner']) + index['parent'][i])
+    if not hits:
+        return result
+
+    # Holes are stored as additional rings of the same path, so a point is
+    # inside of a path if it's inside of an odd number of its rings.
+    hits, counts = np.unique(np.concatenate(hits), return_counts=True)
+    hits = hits[counts % 2 == 1]
+    which, parent = np.divmod(hits, len(index['owner']))
+    # The bands of a filled contour set shouldn't overlap, but points on a
+    # shared edge can be inside of more than one. Keep the lowest path index
+    # for each point (i.e. the first collection, as when picking artists in
+    # order). ``hits`` is sorted, so that's the first one for each point.
+    which, first = np.unique(which, return_index=True)
+    result[which] = parent[first]
+    return result
+
+def _contour_index(cs):
+    """
+    Get the (cached) index of the paths of a filled ``ContourSet``. Each path
+    is split into its rings (outer boundaries and holes), which are sorted by
+    the left edge of their bounding box. Only rebuilt if the contour set's
+    paths change.
+    """
+    # ``set_paths`` replaces the list of paths, so it's enough to compare the
+    # lists (and their lengths) of each collection instead of every path.
+    key = [(coll.get_paths(), len(coll.get_paths()))
+           for coll in cs.collections]
+    index = getattr(cs, '_mpldatacursor_index', None)
+    if index is not None and _same_paths(index['key'], key):
+        return index
+
+    owner, pathnum, rings, parent = [], [], [], []
+    for k, coll in enumerate(cs.collections):
+        for n, path in enumerate(coll.get_paths()):
+            for ring in path.to_polygons(closed_only=False):
+                if len(ring) > 2:
+                    rings.append(ring)
+                    parent.append(len(owner))
+            owner.append(k)
+            pathnum.append(n)
+
+    bounds = np.array([[ring[:, 0].min(), ring[:, 0].max(),
+                        ring[:, 1].min(), ring[:, 1].max()]
+                       for ring in rings], dtype=float).reshape(-1, 4)
+    order = np.argsort(bounds[:, 0], kind='mergesort')
+    index = dict(key=key, last=(None, None),
+                 owner=np.array(owner, dtype=int),
+                 pathnum=np.array(pathnum, dtype=int),
+                 rings=[Path(rings[i]) for i in order],
+                 parent=np.array(parent, dtype=int)[order],
+                 bounds=bounds[order].T)
+    cs._mpldatacursor_index = index
+    return index
+
+def _same_paths(key1, key2):
+    """Compare two keys from ``_contour_index`` by identity."""
+    if len(key1) != len(key2):
+        return False
+    return all(paths1 is paths2 and n1 == n2
+               for (paths1, n1), (paths2, n2) in zip(key1, key2))
+
+def grid_interpolator(x, y, z):
+    """
+    Precompute what's needed to bilinearly interpolate the values *z* of a
+    rectilinear grid (e.g. the X, Y, Z arrays passed to ``contour``).
+
+    Parameters
+    -----------
+    x, y : arrays
+        The coordinates of the grid's columns and rows. Either 1D, or 2D
+        arrays with the same shape as *z* (e.g. created with
+        ``np.meshgrid``).
+    z : 2D array
+        The values at each grid point.
+
+    Returns
+    --------
+    grid : dict
+        Pass this to ``interpolate_grid``.
+    """
+    z = np.ma.filled(np.ma.asarray(z, dtype=float), np.nan)
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    if x.ndim == 2 and y.ndim == 2:
+        if not (np.all(x == x[:1, :]) and np.all(y == y[:, :1])):
+            raise ValueError('Only rectilinear X and Y grids are supported.')
+        x, y = x[0], y[:, 0]
+    if z.ndim != 2 or z.shape != (len(y), len(x)):
+        raise ValueError('Z must be 2D with a shape of (len(Y), len(X)).')
+    if len(x) > 1 and x[0] > x[-1]:
+        x, z = x[::-1], z[:, ::-1]
+    if len(y) > 1 and y[0] > y[-1]:
+        y, z = y[::-1], z[::-1, :]
+    if len(x) < 2 or len(y) < 2 or np.any(np.diff(x) <= 0) \
+            or np.any(np.diff(y) <= 0):
+        raise ValueError('X and Y must be monotonic with at least 2 points.')
+    return dict(x=x, y=y, z=z)
+
+def interpolate_grid(grid, x, y):
+    """
+    Bilinearly interpolate a grid (see ``grid_interpolator``) at x, y.
+    Returns None if x, y is outside the grid or next to a masked/NaN value.
+    """
+    j = _edge_index(grid['x'], x)
+    i = _edge_index(grid['y'], y)
+    if i is None or j is None:
+        return None
+    gx, gy, z = grid['x'], grid['y'], grid['z']
+    tx = (x - gx[j]) / (gx[j + 1] - gx[j])
+    ty = (y - gy[i]) / (gy[i + 1] - gy[i])
+    value = ((z[i, j] * (1 - tx) + z[i, j + 1] * tx) * (1 - ty)
+           + (z[i + 1, j] * (1 - tx) + z[i + 1, j + 1] * tx) * ty)
+    if np.isnan(value):
+        return None
+    return value
+
 def scatter_props(event):
     """
     Get information for a pick event on a PathCollection artist (usually
@@ -220,7 +812,7 @@ def scatter_props(event):
     except AttributeError:
         sizes = None
     # If a constant size/s was specified, don't return it
-    if sizes is None or len(sizes) == 1:
+    if sizes is None or len(sizes) <= 1:
         s = None
     else:
         s = sizes[ind]
@@ -235,35 +827,145 @@ def scatter_props(event):
         return dict(s=s)
 
 def errorbar_props(event):
+    """
+    Get information for a pick event on an artist that's part of an
+    ``ErrorbarContainer`` (i.e. created by ``errorbar``).
+
+    Parameters
+    -----------
+    event : PickEvent
+        The pick event to process
+
+    Returns
+    --------
+    A dict with keys:
+        `x`, `y`: The data point nearest to the artist that was picked.
+        `xerror`, `yerror`: The error of the point (None if the lower and upper
+            errors differ).
+        `xerror_lower`, `xerror_upper`, `yerror_lower`, `yerror_upper`: The
+            lower and upper errors of the point.
+
+    Notes
+    -----
+    The errors are extracted from the error bars once and cached on the
+    container.
+    """
     if hasattr(event.artist, '_mpldatacursor_parent'):
         container = event.artist._mpldatacursor_parent
     else:
         return {}
-    
-    if hasattr(event, 'ind') and event.ind is not None:
+
+    if getattr(event, 'ind', None) is not None and len(event.ind):
         i = event.ind[0]
     else:
         return {}
 
-    xerr = yerr = [None] * i
-    if container.has_yerr and container.has_xerr:
-        xerr = _extract_xerr(container[2][0])
-        yerr = _extract_yerr(container[2][1])
-    elif container.has_yerr:
-        xerr = _extract_xerr(container[2][0])
-    elif container.has_xerr:
-        yerr = _extract_xerr(container[2][0])
+    info = _errorbar_info(container)
+    xy = info['xy']
+    if event.artist in info['owners']:
+        # Picked an error bar: "ind" is the index of the bar, not the point.
+        i = info['owners'][event.artist][i]
+    elif event.artist is not container[0]:
+        # A cap, etc. Use the data point nearest to it.
+        point = event.artist.get_xydata()[i]
+        i = np.nanargmin(np.hypot(*(xy - point).T))
+
+    props = {'x':xy[i, 0], 'y':xy[i, 1]}
+    for name in ['xerror', 'yerror']:
+        lower, upper = info[name][0][i], info[name][1][i]
+        if np.isnan(lower):
+            lower = upper = None
+        symmetric = lower is not None and np.isclose(lower, upper)
+        props[name] = lower if symmetric else None
+        props[name + '_lower'], props[name + '_upper'] = lower, upper
+    return props
+
+def _errorbar_info(container):
+    """
+    Get the (cached) data points and the lower and upper errors of each point
+    of an ``ErrorbarContainer``. Only recomputed if its data or error bars
+    change.
+    """
+    line, caps, barcols = container
+    key = [id(col.get_paths()) for col in barcols]
+    if line is not None:
+        key.append(id(line.get_xydata()))
+    info = getattr(container, '_mpldatacursor_errors', None)
+    if info is not None and info['key'] == key:
+        return info
+
+    # X error bars are added before y error bars
+    cols = list(barcols)
+    xcol = cols.pop(0) if container.has_xerr and cols else None
+    ycol = cols.pop(0) if container.has_yerr and cols else None
+    segments = [(col, axis, _stack_segments(col))
+                for col, axis in [(xcol, 0), (ycol, 1)] if col is not None]
+
+    if line is not None:
+        xy = np.asarray(line.get_xydata(), dtype=float)
+    else:
+        # No data line (fmt='none'). Assume the bars are centered.
+        col, axis, segs = segments[0]
+        xy = segs.mean(axis=1)
+
+    info = dict(key=key, xy=xy, owners={})
+    for name in ['xerror', 'yerror']:
+        info[name] = np.full(len(xy), np.nan), np.full(len(xy), np.nan)
+    for col, axis, segs in segments:
+        owner = _segment_owners(xy, segs, axis)
+        lower, upper = info['xerror' if axis == 0 else 'yerror']
+        values = xy[owner, axis]
+        lower[owner] = values - segs[:, :, axis].min(axis=1)
+        upper[owner] = segs[:, :, axis].max(axis=1) - values
+        info['owners'][col] = owner
+    container._mpldatacursor_errors = info
+    return info
+
+def _stack_segments(collection):
+    """The 2-point segments of a LineCollection as an Mx2x2 array."""
+    paths = collection.get_paths()
+    if not paths:
+        return np.empty((0, 2, 2))
+    return np.array([path.vertices[:2] for path in paths], dtype=float)
 
-    x, y = container[0].get_xydata().T
-    return {'xerror':xerr[i], 'yerror':yerr[i], 'x':x[i], 'y':y[i]}
+def _segment_owners(xy, segments, axis):
+    """
+    The index of the data point each error bar along *axis* belongs to. There
+    is one bar per point unless ``errorevery`` was used, in which case each
+    bar is matched to the first point it passes through (i.e. with the same
+    coordinate along the other axis and between the ends of the bar) that
+    isn't before the bar's position in the sequence of bars.
+    """
+    if len(segments) == len(xy):
+        return np.arange(len(xy))
 
-def _extract_yerr(errbar_artist):
-    segments = errbar_artist.get_segments()
-    return [abs(np.diff(seg[:,1])[0]) for seg in segments]
+    # Find the points with the same coordinate along the other axis as each
+    # bar. Ties are sorted by index, so each bar's points are in order.
+    other = 1 - axis
+    order = np.lexsort((np.arange(len(xy)), xy[:, other]))
+    keys = xy[order, other]
+    fixed = segments[:, 0, other]
+    lo = np.searchsorted(keys, fixed, side='left')
+    counts = np.searchsorted(keys, fixed, side='right') - lo
 
-def _extract_xerr(errbar_artist):
-    segments = errbar_artist.get_segments()
-    return [abs(np.diff(seg[:,0])[0]) for seg in segments]
+    # One (bar, point) pair for each of those points.
+    bar = np.repeat(np.arange(len(segments)), counts)
+    offset = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts,
+                                                 counts)
+    point = order[np.repeat(lo, counts) + offset]
+    value = xy[point, axis]
+    low = segments[:, :, axis].min(axis=1)[bar]
+    high = segments[:, :, axis].max(axis=1)[bar]
+    # The bars are drawn for a subset of the points, in order, so the k-th
+    # bar can't belong to a point before the k-th one.
+    valid = np.flatnonzero((low <= value) & (value <= high) & (point >= bar))
+
+    # A bar that doesn't pass through any point is matched to the next
+    # point along the other axis.
+    owner = order[np.minimum(lo, len(xy) - 1)]
+    bars, first = np.unique(bar[valid], return_index=True)
+    owner[bars] = point[valid[first]]
+    return owner
 
 def three_dim_props(event):
     """
@@ -277,13 +979,17 @@ def three_dim_props(event):
     Returns
     --------
     A dict with keys:
-        `x`: The estimated x-value of the click on the artist
-        `y`: The estimated y-value of the click on the artist
-        `z`: The estimated z-value of the click on the artist
+        `x`: The x-value of the data point nearest the click
+        `y`: The y-value of the data point nearest the click
+        `z`: The z-value of the data point nearest the click
+        `ind`: The index of that data point
 
     Notes
     -----
-    Based on mpl_toolkits.axes3d.Axes3D.format_coord
+    The projected 2D coordinates of the artist's data are cached and reused
+    until the view (``ax.M``) changes. For 3D artists without data points,
+    the x, y, z of the click is estimated instead (and `ind` isn't returned)
+    based on mpl_toolkits.axes3d.Axes3D.format_coord.
     Many thanks to Ben Root for pointing this out!
     """
     ax = event.artist.axes
@@ -291,20 +997,25 @@ def three_dim_props(event):
         return {}
 
     xd, yd = event.mouseevent.xdata, event.mouseevent.ydata
-    p = (xd, yd)
-    edges = ax.tunit_edges()
-    ldists = [(mplot3d.proj3d.line2d_seg_dist(p0, p1, p), i) for \
-                i, (p0, p1) in enumerate(edges)]
-    ldists.sort()
+    projected = _projected_3d(event.artist, ax.M)
+    if projected is not None:
+        xyz, px, py = projected
+        dist = np.hypot(px - xd, py - yd)
+        if np.isfinite(dist).any():
+            i = np.nanargmin(dist)
+            x, y, z = xyz[:, i]
+            return dict(x=x, y=y, z=z, ind=[i])
 
     # nearest edge
-    edgei = ldists[0][1]
-
-    p0, p1 = edges[edgei]
+    edges = np.asarray(ax.tunit_edges(), dtype=float)
+    p0, p1 = edges[:, 0], edges[:, 1]
+    _, _, _, dists = _project_to_segments(p0[:, 0], p0[:, 1],
+                                          p1[:, 0], p1[:, 1], xd, yd)
+    edgei = dists.argmin()
 
     # scale the z value to match
-    x0, y0, z0 = p0
-    x1, y1, z1 = p1
+    x0, y0, z0 = p0[edgei]
+    x1, y1, z1 = p1[edgei]
     d0 = np.hypot(x0-xd, y0-yd)
     d1 = np.hypot(x1-xd, y1-yd)
     dt = d0+d1
@@ -313,6 +1024,38 @@ def three_dim_props(event):
     x, y, z = mplot3d.proj3d.inv_transform(xd, yd, z, ax.M)
     return dict(x=x, y=y, z=z)
 
+def _projected_3d(artist, M):
+    """
+    Get the (cached) 3xN data array of a 3D artist and its x & y coordinates
+    projected with the view matrix *M*. Only reprojected if the view or the
+    artist's data changes. Returns None for artists without data points.
+    """
+    source = _source_3d(artist)
+    if source is None:
+        return None
+
+    cache = getattr(artist, '_mpldatacursor_projected', None)
+    if cache is None or cache['source'] is not source:
+        xyz = np.array([np.ma.filled(np.ma.asarray(item, dtype=float), np.nan)
+                        .ravel() for item in source[:3]])
+        cache = dict(source=source, xyz=xyz, M=None, xy=None)
+        artist._mpldatacursor_projected = cache
+
+    if cache['M'] is None or not np.array_equal(cache['M'], M):
+        xs, ys, zs = cache['xyz']
+        px, py, _ = mplot3d.proj3d.proj_transform(xs, ys, zs, M)
+        cache['M'] = np.array(M, copy=True)
+        cache['xy'] = np.asarray(px, dtype=float), np.asarray(py, dtype=float)
+    return (cache['xyz'],) + cache['xy']
+
+def _source_3d(artist):
+    """The 3D data of a Line3D, 3D scatter or Poly3DCollection, if any."""
+    for attr in ['_verts3d', '_offsets3d', '_vec']:
+        source = getattr(artist, attr, None)
+        if source is not None and len(source) >= 3:
+            return source
+    return None
+
 def rectangle_props(event):
     """
     Returns the width, height, left, and bottom of a rectangle artist.
@@ -368,3 +1111,218 @@ def get_xy(artist):
         xy = artist.get_xydata().T
 
     return xy
+
+#-- Vectorized pick info (see ``DataCursor.query``) ---------------------------
+
+def array_props(artist, ind, x, y):
+    """
+    Get the information for many picks on a single artist at once. This is
+    the array version of the functions registered for the artist's type (see
+    ``get_pick_info_funcs``) for lines, scatter plots, images and
+    ``QuadMesh``'s.
+
+    Parameters
+    -----------
+    artist : A matplotlib artist
+        The artist that was picked.
+    ind : array of ints
+        The first item of the pick event's "ind" for each pick (ignored for
+        images).
+    x, y : arrays
+        The data coordinates of each pick.
+
+    Returns
+    --------
+    props : dict or None
+        A dict of the same keys that the pick info functions would return,
+        with an array (or list) of values for each pick, or None where they
+        would return None. Returns None if there isn't an array version for
+        the artist (e.g. other functions have been registered for its type,
+        or it's part of an errorbar plot).
+    """
+    funcs = tuple(get_pick_info_funcs(type(artist)))
+    if funcs == (line_props, errorbar_props):
+        if hasattr(artist, '_mpldatacursor_parent'):
+            return None
+        return _line_props_array(artist, ind, x, y)
+    elif funcs == (scatter_props, collection_props):
+        return _scatter_props_array(artist, ind)
+    elif funcs == (image_props,):
+        return _image_props_array(artist, x, y)
+    elif funcs == (quadmesh_props,):
+        return _quadmesh_props_array(artist, ind)
+    return None
+
+def image_hits(im, x, y):
+    """Whether each of the points *x*, *y* (in data coordinates) is inside of
+    the image *im*."""
+    nrows, ncols = _image_array(im).shape[:2]
+    i, j = _index_transform(im).transform(np.column_stack([y, x])).T
+    return (i >= 0) & (i <= nrows) & (j >= 0) & (j <= ncols)
+
+def quadmesh_hits(artist, x, y):
+    """
+    Vectorized ``quadmesh_cell`` for the points *x*, *y* (in display
+    coordinates). Returns the index of each point's cell in the mesh's
+    flattened array of cells (-1 outside of the mesh), or None if the mesh
+    isn't rectilinear.
+    """
+    grid = _quadmesh_grid(artist)
+    if grid['xedges'] is None:
+        return None
+    mx, my = artist.get_transform().inverted().transform(
+        np.column_stack([x, y])).T
+    j = _edge_indices(grid['xedges'], mx)
+    i = _edge_indices(grid['yedges'], my)
+    ncols = grid['x'].shape[1] - 1
+    return np.where((i >= 0) & (j >= 0), i * ncols + j, -1)
+
+def _line_props_array(artist, ind, x, y):
+    """
+    Vectorized ``line_props``. Each pick is interpolated along the segments
+    drawn next to vertex *ind* (``line_props`` does the same, except that it
+    also looks at every segment near the pick for lines with sorted x).
+    """
+    xy = artist.get_xydata()
+    linestyle = artist.get_linestyle()
+    if linestyle in ['none', ' ', '', None, 'None']:
+        xy = np.asarray(xy)[ind]
+        return dict(x=xy[:, 0], y=xy[:, 1])
+
+    geometry = _line_geometry(artist)
+    step, screen = geometry['step'], geometry['screen']
+    # The drawn vertices from step * (i - 1) to step * (i + 2), as in
+    # ``line_props``. Windows clipped by the ends of the line are padded
+    # with zero-length segments at their last vertex.
+    first = np.maximum(step * (ind - 1), 0)
+    last = np.minimum(step * (ind + 2), len(screen)) - 1
+    vertices = np.minimum(first[:, None] + np.arange(3 * step), last[:, None])
+    xs, ys = screen[vertices, 0], screen[vertices, 1]
+
+    transform = artist.axes.transData
+    xclick, yclick = transform.transform(np.column_stack([x, y])).T
+    xp, yp, _, dist = _project_to_segments(
+        xs[:, :-1], ys[:, :-1], xs[:, 1:], ys[:, 1:],
+        xclick[:, None], yclick[:, None])
+    k = np.argmin(np.where(np.isnan(dist), np.inf, dist), axis=1)
+    rows = np.arange(len(k))
+    x, y = transform.inverted().transform(
+        np.column_stack([xp[rows, k], yp[rows, k]])).T
+    return dict(x=x, y=y)
+
+def _scatter_props_array(artist, ind):
+    """Vectorized ``scatter_props`` and ``collection_props``."""
+    sizes = artist.get_sizes()
+    s = None if sizes is None or len(sizes) <= 1 else np.asarray(sizes)[ind]
+    arr = artist.get_array()
+    z = None if arr is None or len(arr) == 1 else arr[ind]
+    props = dict(s=s, z=z, c=z)
+    offsets = np.asarray(artist.get_offsets())
+    if len(offsets) > np.max(ind, initial=-1):
+        props['x'], props['y'] = offsets[ind].T
+    return props
+
+def _image_props_array(im, x, y):
+    """Vectorized ``image_props``. Only the elements under the picks are
+    read from the image's array."""
+    arr = _image_array(im)
+    nrows, ncols = arr.shape[:2]
+    i, j = _index_transform(im).transform(np.column_stack([y, x])).T
+    i = np.clip(i.astype(int), 0, nrows - 1)
+    j = np.clip(j.astype(int), 0, ncols - 1)
+    return dict(z=_array_values(arr[i, j]), i=i, j=j)
+
+def _quadmesh_props_array(artist, ind):
+    """Vectorized ``quadmesh_props`` for picks inside of the mesh. Returns
+    None for Gouraud shading."""
+    grid = _quadmesh_grid(artist)
+    nrows, ncols = grid['x'].shape
+    arr = artist.get_array()
+    if arr is not None and np.size(arr) == nrows * ncols:
+        return None
+
+    i, j = np.divmod(ind, ncols - 1)
+    corners = [(i, j), (i, j + 1), (i + 1, j + 1), (i + 1, j)]
+    qx = np.array([grid['x'][corner] for corner in corners])
+    qy = np.array([grid['y'][corner] for corner in corners])
+    bounds = list(zip(qx.min(axis=0), qx.max(axis=0),
+                      qy.min(axis=0), qy.max(axis=0)))
+
+    z = None
+    if arr is not None and np.size(arr) > 1:
+        if np.ndim(arr) == 1:
+            z = _array_values(arr[ind])
+        else:
+            z = _array_values(arr[i, j])
+    return dict(i=i, j=j, z=z, c=z, bounds=bounds)
+
+def _array_values(z):
+    """Values of multi-channel arrays (e.g. RGB images) are displayed as
+    strings, as in ``image_props``."""
+    if np.ndim(z) > 1:
+        return [', '.join('{:0.3g}'.format(item) for item in np.ravel(row))
+                for row in z]
+    return z
+
+#-- Pick info function registry -----------------------------------------------
+_registry = {}
+_resolved = {}
+
+def register_pick_info(artist_type, func):
+    """
+    Register a function to get information for pick events on artists of a
+    given type (or subclasses of it).
+
+    Parameters
+    -----------
+    artist_type : class
+        The artist class (e.g. ``matplotlib.lines.Line2D``).
+    func : callable
+        A function that takes a ``PickEvent`` and returns a dict of
+        information about it. The dict is passed as kwargs to the
+        datacursor's formatter.
+
+    Notes
+    -----
+    Functions registered for the same type are called in the order they were
+    registered, and later functions override the values of earlier ones.
+    Artists use the functions registered for the closest class in their MRO.
+    """
+    _registry.setdefault(artist_type, []).append(func)
+    _resolved.clear()
+
+def get_pick_info_funcs(artist_type):
+    """
+    Get the list of functions registered for *artist_type* (or the closest of
+    its base classes). The lookup is cached per type.
+    """
+    try:
+        return _resolved[artist_type]
+    except KeyError:
+        pass
+    funcs = []
+    for klass in artist_type.__mro__:
+        if klass in _registry:
+            funcs = _registry[klass]
+            break
+    _resolved[artist_type] = funcs
+    return funcs
+
+for _type, _funcs in [
+        (AxesImage, [image_props]),
+        (PathCollection, [scatter_props, collection_props]),
+        (Line2D, [line_props, errorbar_props]),
+        (LineCollection, [collection_props, errorbar_props]),
+        (PatchCollection, [collection_props]),
+        (PolyCollection, [collection_props, scatter_props]),
+        (QuadMesh, [quadmesh_props]),
+        (Rectangle, [rectangle_props]),
+        (art3d.Line3D, [three_dim_props]),
+        (art3d.Line3DCollection, [three_dim_props]),
+        (art3d.Patch3D, [three_dim_props]),
+        (art3d.Patch3DCollection, [three_dim_props]),
+        (art3d.Path3DCollection, [three_dim_props]),
+        (art3d.Poly3DCollection, [three_dim_props]),
+        ]:
+    for _func in _funcs:
+        register_pick_info(_type, _func)
@@ -0,0 +1,293 @@
+__license__ = """
+Copyright (c) 2012 mpldatacursor developers
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+import numpy as np
+import matplotlib.artist
+from matplotlib.collections import LineCollection, PathCollection
+from matplotlib.lines import Line2D
+from matplotlib.patches import FancyBboxPatch
+from matplotlib.text import Text
+from matplotlib.transforms import Bbox, IdentityTransform
+
+# Annotation kwargs that don't apply to the text of a pin.
+_annotation_only_kwargs = ['xy', 'xycoords', 'xytext', 'textcoords', 'bbox',
+                           'arrowprops', 'annotation_clip', 'picker',
+                           'ha', 'horizontalalignment',
+                           'va', 'verticalalignment']
+
+class Pin(object):
+    """
+    A single annotation drawn by a ``PinnedAnnotations`` layer. This has the
+    parts of the ``Annotation`` interface that DataCursor uses (text, ``xy``,
+    ``xyann``, alignment, visibility, ``contains`` and the window extent), but
+    isn't an artist itself.
+    """
+    def __init__(self, layer, ax, xytext=(0, 0)):
+        self.layer = layer
+        self.axes = ax
+        self.figure = layer.figure
+        self.xy = (0, 0)
+        self.xyann = tuple(xytext)
+        self.text = ''
+        self.ha, self.va = 'left', 'bottom'
+        self._visible = False
+        self._extent = None
+        self._metrics = None, None
+
+    def set_text(self, text):
+        self.text = text
+        self.layer.stale = True
+
+    def get_text(self):
+        return self.text
+
+    def set_horizontalalignment(self, align):
+        self.ha = align
+
+    def set_verticalalignment(self, align):
+        self.va = align
+
+    def set_visible(self, visible):
+        self._visible = visible
+        if not visible:
+            self._extent = None
+        self.layer.stale = True
+
+    def get_visible(self):
+        return self._visible
+
+    def get_horizontalalignment(self):
+        return self.ha
+
+    def get_verticalalignment(self):
+        return self.va
+
+    def get_fontproperties(self):
+        return self.layer._text.get_fontproperties()
+
+    def get_linespacing(self):
+        return self.layer._text._linespacing
+
+    def get_bbox_patch(self):
+        return self.layer.bbox_patch
+
+    def get_window_extent(self, renderer=None):
+        if renderer is not None:
+            self._extent = self.layer.measure([self], renderer)[0]
+        if self._extent is None:
+            return Bbox.null()
+        return Bbox.from_extents(*self._extent)
+
+    def contains(self, mouseevent):
+        return self._contains_point(mouseevent.x, mouseevent.y), {}
+
+    def _contains_point(self, x, y):
+        if not self._visible or self._extent is None:
+            return False
+        x0, y0, x1, y1 = self._extent
+        return x0 <= x <= x1 and y0 <= y <= y1
+
+
+class PinnedAnnotations(matplotlib.artist.Artist):
+    """
+    Draws many pinned annotations (see ``Pin``) for a figure at once. The
+    leader lines, label boxes and markers are each drawn as one collection,
+    and a single ``Text`` is reused for the labels, instead of every
+    annotation being a separate ``Annotation`` with its own patches.
+    """
+    # Draw above the axes, like the Annotations in figure.texts.
+    zorder = 3
+
+    def __init__(self, figure, draggable=False, marker='o', markersize=3,
+                 **kwargs):
+        """
+        Parameters
+        -----------
+        figure : a matplotlib Figure
+            The figure to draw the annotations in.
+        draggable : boolean, optional
+            Whether or not the label boxes can be dragged with the mouse.
+            Defaults to False.
+        marker, markersize : optional
+            The marker drawn at the point each annotation refers to.
+        **kwargs : additional keyword arguments, optional
+            The same keyword arguments ``annotate`` accepts. The "xytext"
+            offset (in points), the "bbox" and "arrowprops" colors and the
+            text properties are used.
+        """
+        matplotlib.artist.Artist.__init__(self)
+        self.set_figure(figure)
+        self.pins = []
+        self.xytext = kwargs.get('xytext', (0, 0))
+
+        bbox = dict(kwargs.get('bbox', None) or {})
+        self.bbox_patch = FancyBboxPatch((0, 0), 1, 1,
+                boxstyle=bbox.pop('boxstyle', 'square,pad=0.3'))
+        arrowprops = dict(kwargs.get('arrowprops', None) or {})
+        linecolor = arrowprops.get('edgecolor', arrowprops.get('color', 'k'))
+
+        text_kwargs = dict((key, value) for key, value in kwargs.items()
+                           if key not in _annotation_only_kwargs)
+        self._text = Text(**text_kwargs)
+        self._lines = LineCollection([], colors=[linecolor])
+        self._boxes = PathCollection([], facecolors=bbox.get('fc',
+                                     bbox.get('facecolor', 'white')),
+                                     edgecolors=bbox.get('edgecolor',
+                                     bbox.get('ec', 'black')),
+                                     alpha=bbox.get('alpha', None))
+        self._markers = Line2D([], [], linestyle='none', marker=marker,
+                               markersize=markersize, color=linecolor)
+        for artist in [self._text, self._lines, self._boxes, self._markers]:
+            artist.set_figure(figure)
+            artist.set_transform(IdentityTransform())
+
+        self._drag = None
+        if draggable:
+            canvas = figure.canvas
+            canvas.mpl_connect('button_press_event', self._on_press)
+            canvas.mpl_connect('motion_notify_event', self._on_motion)
+            canvas.mpl_connect('button_release_event', self._on_release)
+
+    def pin(self, ax):
+        """Create a new (hidden) ``Pin`` for the axes *ax*."""
+        pin = Pin(self, ax, self.xytext)
+        self.pins.append(pin)
+        return pin
+
+    def _anchors(self, pins):
+        """The display coordinates of the points the pins refer to."""
+        xy = np.empty((len(pins), 2))
+        groups = {}
+        for i, pin in enumerate(pins):
+            groups.setdefault(pin.axes, []).append(i)
+        for ax, rows in groups.items():
+            data = np.array([pins[i].xy for i in rows], dtype=float)
+            xy[rows] = ax.transData.transform(data)
+        return xy
+
+    def measure(self, pins, renderer, anchors=None):
+        """
+        The display extents (x0, y0, x1, y1) of the label boxes of *pins*,
+        including the box's padding, as an Nx4 array.
+        """
+        if anchors is None:
+            anchors = self._anchors(pins)
+        scale = renderer.points_to_pixels(1.0)
+        extents = np.empty((len(pins), 4))
+        for i, pin in enumerate(pins):
+            extents[i] = self._text_extent(pin, renderer)
+        positions = anchors + scale * np.array([pin.xyann for pin in pins])
+        extents += np.tile(positions, 2)
+        pad = self._pad_fraction() * self._fontsize(renderer)
+        extents[:, :2] -= pad
+        extents[:, 2:] += pad
+        return extents
+
+    def _text_extent(self, pin, renderer):
+        """The extent of *pin*'s text relative to its position. This only
+        changes with the text, alignment and dpi, so it's cached on the pin
+        instead of laying out the text on every draw."""
+        key = pin.text, pin.ha, pin.va, renderer.points_to_pixels(1.0)
+        cached_key, extent = pin._metrics
+        if cached_key != key:
+            self._place_text(pin, (0, 0), 0)
+            bbox = self._text.get_window_extent(renderer)
+            extent = bbox.x0, bbox.y0, bbox.x1, bbox.y1
+            pin._metrics = key, extent
+        return extent
+
+    def _pad_fraction(self):
+        return getattr(self.bbox_patch.get_boxstyle(), 'pad', 0)
+
+    def _fontsize(self, renderer):
+        return renderer.points_to_pixels(self._text.get_size())
+
+    def _place_text(self, pin, anchor, scale):
+        dx, dy = pin.xyann
+        self._text.set_text(pin.text)
+        self._text.set_position((anchor[0] + dx * scale,
+                                 anchor[1] + dy * scale))
+        self._text.set_horizontalalignment(pin.ha)
+        self._text.set_verticalalignment(pin.va)
+
+    def draw(self, renderer):
+        if not self.get_visible():
+            return
+        pins = [pin for pin in self.pins if pin._visible]
+        if not pins:
+            self.stale = False
+            return
+
+        anchors = self._anchors(pins)
+        extents = self.measure(pins, renderer, anchors)
+        for pin, extent in zip(pins, extents):
+            pin._extent = extent
+
+        # Leader lines run from the closest point on each box to the anchor.
+        starts = np.clip(anchors, extents[:, :2], extents[:, 2:])
+        self._lines.set_segments(np.stack([starts, anchors], axis=1))
+        self._lines.draw(renderer)
+
+        # The box style pads the extent of the text itself.
+        pad = self._pad_fraction() * self._fontsize(renderer)
+        size = self._fontsize(renderer)
+        boxstyle = self.bbox_patch.get_boxstyle()
+        paths = [boxstyle(x0 + pad, y0 + pad, x1 - x0 - 2 * pad,
+                               y1 - y0 - 2 * pad, size)
+                 for x0, y0, x1, y1 in extents]
+        self._boxes.set_paths(paths)
+        self._boxes.draw(renderer)
+
+        scale = renderer.points_to_pixels(1.0)
+        for pin, anchor in zip(pins, anchors):
+            self._place_text(pin, anchor, scale)
+            self._text.draw(renderer)
+
+        self._markers.set_data(anchors[:, 0], anchors[:, 1])
+        self._markers.draw(renderer)
+        self.stale = False
+
+    def pin_at(self, x, y):
+        """The topmost visible pin whose box contains the display point x, y,
+        or None."""
+        for pin in reversed(self.pins):
+            if pin._contains_point(x, y):
+                return pin
+        return None
+
+    def _on_press(self, event):
+        if event.button != 1 or event.canvas.widgetlock.locked():
+            return
+        pin = self.pin_at(event.x, event.y)
+        if pin is not None:
+            self._drag = pin, (event.x, event.y), pin.xyann
+
+    def _on_motion(self, event):
+        if self._drag is None:
+            return
+        pin, (x0, y0), (dx, dy) = self._drag
+        scale = self.figure.dpi / 72.0
+        pin.xyann = (dx + (event.x - x0) / scale, dy + (event.y - y0) / scale)
+        self.stale = True
+        event.canvas.draw_idle()
+
+    def _on_release(self, event):
+        self._drag = None
@@ -0,0 +1,694 @@
+__license__ = """
+Copyright (c) 2012 mpldatacursor developers
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+import numpy as np
+from matplotlib.collections import PathCollection
+from matplotlib.lines import Line2D
+from mpl_toolkits.mplot3d import Axes3D
+
+from . import pick_info
+
+class AxesIndex(object):
+    """
+    A uniform grid over the screen-space geometry of the artists in a single
+    axes. This allows ``DataCursor._select`` to find the artists (and the
+    indices of their vertices/points) under the mouse without calling
+    ``artist.contains`` on every artist for every mouse event.
+
+    Only ``Line2D`` artists and ``PathCollection`` artists with a single marker
+    path (i.e. ``scatter``) are indexed. Other artists should be hit-tested
+    with ``contains`` as usual (see ``AxesIndex.supports``). Lines with more
+    than ``pick_info.large_line_size`` vertices or with monotonically
+    increasing x-values are hit-tested through a ``LinePyramid`` instead of
+    the grid.
+
+    Each artist's items are binned into the grid's cells separately and the
+    cells of all of the artists are merged when querying. The grid is rebuilt
+    lazily whenever the view limits, axes position, dpi or scales change.
+    When an artist is added, removed or its data changes, only that artist's
+    items are re-binned (unless they no longer fit the grid's extent or cell
+    size). Note that in-place modification of an artist's data array will not
+    be detected.
+    """
+    # Cell size (in pixels) to start with. This is doubled until the total
+    # number of (cell, item) entries is within the budget below.
+    min_cell_size = 16
+    max_entries_per_item = 8
+
+    def __init__(self, ax, artists, tolerance=5):
+        """
+        Parameters
+        -----------
+        ax : A matplotlib Axes instance
+            The axes that the artists belong to.
+        artists : sequence of artists
+            The artists to index. Unsupported artists are ignored.
+        tolerance : number, optional
+            The radius (in points) that the mouse must be within to select an
+            artist.
+        """
+        self.ax = ax
+        self.tolerance = tolerance
+        self.artists = [art for art in artists if self.supports(art)]
+        self.invalidate()
+
+    @staticmethod
+    def supports(artist):
+        """Whether or not *artist* can be hit-tested through the index."""
+        # The data coordinates of 3D axes are a projection of the view.
+        if isinstance(artist.axes, Axes3D):
+            return False
+        if isinstance(artist, Line2D):
+            return True
+        if isinstance(artist, PathCollection):
+            return len(artist.get_paths()) == 1
+        return False
+
+    def add(self, artists):
+        """Start indexing *artists*. Unsupported artists are ignored. The
+        other artists' cells (and each line's ``LinePyramid``) are kept."""
+        self.artists.extend(art for art in artists
+                            if self.supports(art) and art not in self.artists)
+
+    def remove(self, artists):
+        """Stop indexing *artists* (a set or other container)."""
+        self.artists = [art for art in self.artists if art not in artists]
+        for artist in artists:
+            self._cells.pop(artist, None)
+
+    def invalidate(self):
+        """Force the whole grid to be rebuilt on the next query."""
+        self._view = None
+        self._layout = None
+        # Artist: (state, segments, cells) for each binned artist.
+        self._cells = {}
+        self._grid = None
+
+    def query(self, x, y):
+        """
+        Find the indexed artists within the tolerance of a point.
+
+        Parameters
+        -----------
+        x, y : numbers
+            The point to test in display (pixel) coordinates.
+
+        Returns
+        --------
+        hits : dict
+            A dict of artist: ind pairs, where "ind" is an array of the indices
+            of the artist's items (vertices or points) that were hit. This
+            mirrors the "ind" returned by ``artist.contains``. Artists that
+            were not hit are not included.
+        """
+        grid_artists, pyramid_artists = self._partition()
+        hits = self._query_grid(grid_artists, x, y)
+        for artist in pyramid_artists:
+            ind = _line_pyramid(artist).query(artist, x, y, self.tolerance)
+            if len(ind):
+                hits[artist] = ind
+        return hits
+
+    def query_points(self, x, y):
+        """
+        Hit-test all of the indexed artists at many points at once.
+
+        Parameters
+        -----------
+        x, y : arrays
+            The points to test in display (pixel) coordinates.
+
+        Returns
+        --------
+        hits : dict
+            A dict of artist: ind pairs for every indexed artist, where "ind"
+            is an array of the first index that ``query`` would return for
+            each point (the lowest vertex/point hit, or else the lowest
+            segment hit), or -1 where the point doesn't hit the artist.
+        """
+        x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        hits = dict((artist, np.full(len(x), -1, dtype=int))
+                    for artist in self.artists)
+        # Every artist goes in a single grid, including the lines that
+        # ``query`` would hit-test through a ``LinePyramid``.
+        grid = self._merged(self.artists)
+        if grid is None or not len(x):
+            return hits
+
+        with np.errstate(invalid='ignore'):
+            cx = np.floor((x - grid['x0']) / grid['size'])
+            cy = np.floor((y - grid['y0']) / grid['size'])
+        points = np.flatnonzero((cx >= 0) & (cx < grid['nx'])
+                                & (cy >= 0) & (cy < grid['ny']))
+        keys = (cx[points] + cy[points] * grid['nx']).astype(int)
+        lo = np.searchsorted(grid['keys'], keys, side='left')
+        counts = np.searchsorted(grid['keys'], keys, side='right') - lo
+
+        # One (point, item) pair for each item in each point's cell.
+        pair_point = np.repeat(points, counts)
+        offset = np.arange(counts.sum()) - np.repeat(np.cumsum(counts)
+                                                     - counts, counts)
+        items = grid['items'][np.repeat(lo, counts) + offset]
+        start_hits, end_hits, line_hits = _segment_hits(
+            grid['segments'][items], grid['radius'][items],
+            x[pair_point], y[pair_point])
+
+        # As in ``_hit_indices``, vertices come before segments.
+        start, end = grid['start'][items], grid['end'][items]
+        vertex_hits = start_hits | end_hits
+        value = np.where(start_hits, start, end)
+        value = np.where(start_hits & end_hits, np.minimum(start, end), value)
+        value = np.where(vertex_hits, value, start)
+        keep = np.flatnonzero(vertex_hits | line_hits)
+        pair_point, value = pair_point[keep], value[keep]
+        owner = grid['owner'][items[keep]]
+        category = (~vertex_hits[keep]).astype(int)
+
+        order = np.lexsort((value, category, owner, pair_point))
+        pair_point, owner, value = (pair_point[order], owner[order],
+                                    value[order])
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = ((pair_point[1:] != pair_point[:-1])
+                     | (owner[1:] != owner[:-1]))
+        for num, artist in enumerate(grid['artists']):
+            mine = first & (owner == num)
+            hits[artist][pair_point[mine]] = (value[mine]
+                                              // grid['divisor'][num])
+        return hits
+
+    def _partition(self):
+        """
+        Split the artists into those hit-tested through the grid and lines
+        that are hit-tested through their ``LinePyramid`` (very large lines
+        and lines with monotonically increasing x-values). The pyramid is
+        built in data coordinates, so (unlike the grid) it doesn't need to be
+        rebuilt when zooming or panning.
+        """
+        grid_artists, pyramid_artists = [], []
+        for artist in self.artists:
+            if (isinstance(artist, Line2D)
+                    and artist.get_transform() is self.ax.transData
+                    and (len(artist.get_xydata()) > pick_info.large_line_size
+                         or pick_info._sorted_x(artist))):
+                pyramid_artists.append(artist)
+            else:
+                grid_artists.append(artist)
+        return grid_artists, pyramid_artists
+
+    def _query_grid(self, artists, x, y):
+        grid = self._merged(artists)
+        if grid is None:
+            return {}
+
+        cx = int(np.floor((x - grid['x0']) / grid['size']))
+        cy = int(np.floor((y - grid['y0']) / grid['size']))
+        if not (0 <= cx < grid['nx'] and 0 <= cy < grid['ny']):
+            return {}
+
+        key = cx + cy * grid['nx']
+        lo, hi = np.searchsorted(grid['keys'], [key, key + 1])
+        items = grid['items'][lo:hi]
+        if not items.size:
+            return {}
+
+        start_hits, end_hits, line_hits = _segment_hits(
+            grid['segments'][items], grid['radius'][items], x, y)
+
+        hits = {}
+        owners = grid['owner'][items]
+        for num in np.unique(owners[start_hits | end_hits | line_hits]):
+            mine = owners == num
+            ind = _hit_indices(grid['start'][items[mine]],
+                               grid['end'][items[mine]], start_hits[mine],
+                               end_hits[mine], line_hits[mine])
+            hits[grid['artists'][num]] = ind // grid['divisor'][num]
+        return hits
+
+    def _merged(self, artists):
+        """
+        The grid over *artists*, with the cells of all of them merged. Only
+        the artists that are new or have changed since the last query are
+        re-binned, as long as the view is the same and the new cells fit
+        within the grid's extent and budget. Returns None if there are no
+        artists.
+        """
+        view = self._view_state()
+        if view != self._view:
+            self.invalidate()
+            self._view = view
+
+        changed = {}
+        for artist in artists:
+            state = _artist_state(artist)
+            cached = self._cells.get(artist)
+            if cached is None or not _same_state(state, cached[0]):
+                changed[artist] = state, _artist_segments(artist,
+                                                          self.tolerance)
+        if changed and self._layout is not None:
+            for artist, (state, segments) in changed.items():
+                cells = _bin(segments, self._layout)
+                self._cells[artist] = state, segments, cells
+            if not self._fits(artists):
+                self._layout = None
+        if self._layout is None:
+            self._relayout(artists, changed)
+
+        cells = [self._cells[artist][2] for artist in artists]
+        grid = self._grid
+        if (grid is None or grid['artists'] != list(artists)
+                or any(a is not b for a, b in zip(grid['cells'], cells))):
+            self._grid = self._merge(artists)
+        return self._grid
+
+    def _view_state(self):
+        """The things that, if changed, require the whole grid to be
+        rebuilt."""
+        ax = self.ax
+        return (tuple(ax.bbox.bounds), tuple(ax.viewLim.bounds),
+                ax.figure.dpi, ax.get_xscale(), ax.get_yscale(),
+                self.tolerance)
+
+    def _fits(self, artists):
+        """Whether the cells of *artists* are within the grid's extent and
+        the budget of (cell, item) entries."""
+        layout = self._layout
+        entries, count = 0, 0
+        for artist in artists:
+            _, segments, (keys, items, visible) = self._cells[artist]
+            radius = segments[1]
+            if radius.size and radius.max() > layout['pad']:
+                return False
+            entries += len(keys)
+            count += visible
+        return entries <= self.max_entries_per_item * count + 1024
+
+    def _relayout(self, artists, changed):
+        """Choose the grid's extent and cell size for all of *artists* and
+        re-bin every one of them."""
+        parts = []
+        for artist in artists:
+            if artist in changed:
+                parts.append(changed[artist])
+            else:
+                parts.append(self._cells[artist][:2])
+        self._layout = _layout([segments for _, segments in parts],
+                               self.ax.bbox.bounds, self.min_cell_size,
+                               self.max_entries_per_item)
+        self._cells = {}
+        for artist, (state, segments) in zip(artists, parts):
+            self._cells[artist] = state, segments, _bin(segments,
+                                                        self._layout)
+
+    def _merge(self, artists):
+        """Merge the cells of *artists* into a single grid."""
+        if not artists:
+            return None
+        cached = [self._cells[artist] for artist in artists]
+        parts = [item[1] for item in cached]
+        segments = np.concatenate([item[0] for item in parts])
+        radius = np.concatenate([item[1] for item in parts])
+        start = np.concatenate([item[2] for item in parts])
+        end = np.concatenate([item[3] for item in parts])
+        divisor = np.array([item[4] for item in parts])
+        counts = [len(item[0]) for item in parts]
+        owner = np.repeat(np.arange(len(parts)), counts)
+
+        # Each artist's cells are already sorted, so a stable sort only has
+        # to merge them.
+        offsets = np.cumsum([0] + counts[:-1])
+        keys = np.concatenate([item[2][0] for item in cached])
+        items = np.concatenate([item[2][1] + offset
+                                for item, offset in zip(cached, offsets)])
+        order = np.argsort(keys, kind='mergesort')
+
+        return dict(self._layout, artists=list(artists),
+                    cells=[item[2] for item in cached],
+                    keys=keys[order], items=items[order], segments=segments,
+                    radius=radius, start=start, end=end, owner=owner,
+                    divisor=divisor)
+
+def _item_boxes(part, layout):
+    """The visible items of *part* (the output of ``_artist_segments``) and
+    their bounding boxes relative to the lower left of *layout*."""
+    segments, radius = part[:2]
+    x0, y0, width, height = layout['bounds']
+    xmin = np.minimum(segments[:, 0], segments[:, 2]) - radius
+    xmax = np.maximum(segments[:, 0], segments[:, 2]) + radius
+    ymin = np.minimum(segments[:, 1], segments[:, 3]) - radius
+    ymax = np.maximum(segments[:, 1], segments[:, 3]) + radius
+    visible = ((xmax >= x0) & (xmin <= x0 + width) &
+               (ymax >= y0) & (ymin <= y0 + height))
+    visible &= np.isfinite(segments).all(axis=1)
+    items = np.flatnonzero(visible)
+    return (items, xmin[items] - x0, xmax[items] - x0, ymin[items] - y0,
+            ymax[items] - y0)
+
+def _cell_spans(boxes, layout):
+    """The first cell column and row of each box and the number of columns
+    and cells it covers."""
+    _, xmin, xmax, ymin, ymax = boxes
+    size, nx, ny = layout['size'], layout['nx'], layout['ny']
+    cx0 = np.clip((xmin // size).astype(int), 0, nx - 1)
+    cx1 = np.clip((xmax // size).astype(int), 0, nx - 1)
+    cy0 = np.clip((ymin // size).astype(int), 0, ny - 1)
+    cy1 = np.clip((ymax // size).astype(int), 0, ny - 1)
+    spans_x = cx1 - cx0 + 1
+    return cx0, cy0, spans_x, spans_x * (cy1 - cy0 + 1)
+
+def _layout(parts, bounds, min_cell_size, max_entries_per_item):
+    """
+    Choose the extent and cell size of a grid for *parts* (the output of
+    ``_artist_segments`` for each artist) over an axes with the display-space
+    *bounds*. The cell size is doubled until the items don't span more than
+    *max_entries_per_item* cells each (on average).
+    """
+    # Clip the grid to the region of the axes plus the largest radius.
+    # Anything outside of that can't be under the mouse.
+    pad = max([part[1].max() for part in parts if part[1].size] or [0])
+    x0, y0, width, height = bounds
+    x0, y0 = x0 - pad, y0 - pad
+    width, height = width + 2 * pad, height + 2 * pad
+    layout = dict(x0=x0, y0=y0, pad=pad, bounds=(x0, y0, width, height))
+    boxes = [_item_boxes(part, layout) for part in parts]
+
+    budget = (max_entries_per_item * sum(len(box[0]) for box in boxes)
+              + 1024)
+    size = min_cell_size
+    while True:
+        nx = max(int(np.ceil(width / size)), 1)
+        ny = max(int(np.ceil(height / size)), 1)
+        layout.update(size=size, nx=nx, ny=ny)
+        total = sum(_cell_spans(box, layout)[3].sum() for box in boxes)
+        if total <= budget or (nx == 1 and ny == 1):
+            return layout
+        size *= 2
+
+def _bin(part, layout):
+    """
+    Bin the items of *part* (the output of ``_artist_segments``) into
+    every cell of *layout* that their bounding boxes cover. Returns the cell
+    keys (sorted) and item of each (cell, item) entry, and the number of
+    visible items.
+    """
+    boxes = _item_boxes(part, layout)
+    items = boxes[0]
+    cx0, cy0, spans_x, spans = _cell_spans(boxes, layout)
+    total = spans.sum()
+    repeated = np.repeat(np.arange(len(items)), spans)
+    starts = np.repeat(np.cumsum(spans) - spans, spans)
+    offset = np.arange(total) - starts
+    cx = cx0[repeated] + offset % spans_x[repeated]
+    cy = cy0[repeated] + offset // spans_x[repeated]
+    keys = cx + cy * layout['nx']
+
+    order = np.argsort(keys, kind='mergesort')
+    return keys[order], items[repeated[order]], len(items)
+
+class LinePyramid(object):
+    """
+    A multi-resolution min/max envelope of the vertices of a (potentially
+    huge) Line2D in data coordinates.
+
+    Level 0 holds the bounding box of each block of ``leaf_size`` consecutive
+    segments, and each level above holds the bounding box of pairs of blocks
+    in the level below. Hit-testing descends from the coarsest level, keeping
+    only the blocks whose envelope could be within the tolerance of the mouse
+    (for time series, the blocks in the pixel column under the mouse), and
+    then tests the raw segments of the remaining blocks exactly.
+
+    The pyramid doesn't depend on the view, so it's built once per line and
+    is only updated when the line's data changes. If data is appended to the
+    line, only the blocks at the end of each level are recomputed.
+    """
+    leaf_size = 64
+
+    def __init__(self):
+        self.data = None
+        self.x = self.y = None
+        self.step = 1
+        self.drawstyle = None
+        self.sorted = False
+        self.levels = []
+
+    def update(self, artist):
+        """Update the pyramid to match the current data of *artist*."""
+        data = artist.get_xydata()
+        drawstyle = artist.drawStyles[artist.get_drawstyle()]
+        if data is self.data and drawstyle == self.drawstyle:
+            return
+
+        # The last drawn vertices of the old data (two for steps-mid) depend
+        # on the points after them, so they need to be recomputed.
+        keep = len(self.data) - 1 if self.data is not None else -1
+        skip = 0
+        if drawstyle == '_draw_steps_mid':
+            keep, skip = keep - 1, 1
+
+        if (drawstyle == self.drawstyle and keep >= 0
+                and self._is_appended(data)):
+            tail = np.asarray(data[keep:], dtype=float)
+            x, y = pick_info._step_vertices(tail[:, 0], tail[:, 1], drawstyle)
+            first = self.step * keep + skip
+            self.x = np.concatenate([self.x[:first], x[skip:]])
+            self.y = np.concatenate([self.y[:first], y[skip:]])
+        else:
+            first = 0
+            xy = np.asarray(data, dtype=float)
+            self.x, self.y = pick_info._step_vertices(xy[:, 0], xy[:, 1],
+                                                      drawstyle)
+            self.levels = []
+
+        self.data = data
+        self.drawstyle = drawstyle
+        self.step = 1 if drawstyle == '_draw_lines' else 2
+        self.sorted = pick_info._sorted_x(artist)
+        self._build(first)
+
+    def _is_appended(self, data):
+        """Whether *data* looks like the previous data with more points added
+        to the end. Only a sample of the old points is compared."""
+        old = self.data
+        if old is None or len(data) <= len(old):
+            return False
+        sample = np.unique(np.linspace(0, len(old) - 1, 64).astype(int))
+        return np.array_equal(np.asarray(data[sample]), old[sample])
+
+    def _build(self, first=0):
+        """(Re)compute every block that includes vertex *first* or later."""
+        size = self.leaf_size
+        block = first // size
+        xmin, xmax = _block_extrema(self.x[block * size:], size)
+        ymin, ymax = _block_extrema(self.y[block * size:], size)
+        levels = [self._splice(0, block, [xmin, xmax, ymin, ymax])]
+        funcs = [np.fmin, np.fmax, np.fmin, np.fmax]
+        while len(levels[-1][0]) > 1:
+            # Recompute the pairs of blocks that include the changed ones.
+            block //= 2
+            new = [_pairwise(item[2 * block:], func)
+                   for item, func in zip(levels[-1], funcs)]
+            levels.append(self._splice(len(levels), block, new))
+        self.levels = levels
+
+    def _splice(self, num, block, new):
+        """Replace the blocks of level *num* from *block* on with *new*."""
+        if num >= len(self.levels) or block == 0:
+            return new
+        return [np.concatenate([item[:block], part])
+                for item, part in zip(self.levels[num], new)]
+
+    def candidates(self, xmin, xmax, ymin, ymax):
+        """Indices of the segments (i.e. the vertex each starts at) whose
+        block envelope intersects the given data-space rectangle."""
+        if self.sorted:
+            # For monotonic x (e.g. time series), the segments that overlap
+            # the rectangle in x can be found directly, so only the y
+            # envelopes of their blocks need to be checked.
+            lo, hi = pick_info._segment_range(self.x, xmin, xmax)
+            if hi <= lo:
+                return np.array([], dtype=int)
+            bymin, bymax = self.levels[0][2:]
+            blocks = np.arange(lo // self.leaf_size,
+                               (hi - 1) // self.leaf_size + 1)
+            blocks = blocks[(bymax[blocks] >= ymin) & (bymin[blocks] <= ymax)]
+            segments = (blocks[:, np.newaxis] * self.leaf_size
+                        + np.arange(self.leaf_size)).ravel()
+            return segments[(segments >= lo) & (segments < hi)]
+
+        blocks = np.arange(len(self.levels[-1][0]))
+        for num in range(len(self.levels) - 1, -1, -1):
+            bxmin, bxmax, bymin, bymax = self.levels[num]
+            blocks = blocks[blocks < len(bxmin)]
+            keep = ((bxmax[blocks] >= xmin) & (bxmin[blocks] <= xmax) &
+                    (bymax[blocks] >= ymin) & (bymin[blocks] <= ymax))
+            blocks = blocks[keep]
+            if num:
+                blocks = np.concatenate([2 * blocks, 2 * blocks + 1])
+        segments = (blocks[:, np.newaxis] * self.leaf_size
+                    + np.arange(self.leaf_size)).ravel()
+        return np.sort(segments[segments < max(len(self.x) - 1, 1)])
+
+    def query(self, artist, x, y, tolerance):
+        """
+        Hit-test *artist* at the display coordinates *x*, *y*. Returns the
+        indices of the artist's vertices that were hit (in the same form as
+        ``AxesIndex.query``).
+        """
+        self.update(artist)
+        pixels = tolerance * artist.figure.dpi / 72.0
+        transform = artist.get_transform()
+        corners = transform.inverted().transform(
+            [[x - pixels, y - pixels], [x + pixels, y + pixels]])
+        (xmin, ymin), (xmax, ymax) = np.sort(corners, axis=0)
+        segments = self.candidates(xmin, xmax, ymin, ymax)
+        if not segments.size:
+            return np.array([], dtype=int)
+
+        linestyle = artist.get_linestyle()
+        if linestyle in ['none', ' ', '', None, 'None'] or len(self.x) < 2:
+            # Markers are only drawn at the data points.
+            vertices = np.concatenate([segments, segments + 1]) // self.step
+            vertices = np.unique(vertices[vertices < len(self.data)])
+            xy = transform.transform(np.asarray(self.data)[vertices])
+            xy = np.hstack([xy, xy])
+            start = end = vertices
+            step = 1
+        else:
+            start, end, step = segments, segments + 1, self.step
+            xy = transform.transform(np.column_stack(
+                [np.concatenate([self.x[start], self.x[end]]),
+                 np.concatenate([self.y[start], self.y[end]])]))
+            xy = np.hstack([xy[:len(start)], xy[len(start):]])
+
+        radius = np.full(len(xy), pixels)
+        start_hits, end_hits, line_hits = _segment_hits(xy, radius, x, y)
+        return _hit_indices(start, end, start_hits, end_hits,
+                            line_hits) // step
+
+def _line_pyramid(artist):
+    """Get the (cached) LinePyramid for *artist*."""
+    pyramid = getattr(artist, '_mpldatacursor_pyramid', None)
+    if pyramid is None:
+        pyramid = LinePyramid()
+        artist._mpldatacursor_pyramid = pyramid
+    return pyramid
+
+def _block_extrema(v, size):
+    """Min and max of *v* over blocks of *size* segments (i.e. *size* + 1
+    vertices, as consecutive blocks share their boundary vertex)."""
+    nblocks = max(int(np.ceil((len(v) - 1) / float(size))), 1)
+    padded = np.full(nblocks * size + 1, np.nan)
+    padded[:len(v)] = v
+    body = padded[:-1].reshape(nblocks, size)
+    boundary = padded[size::size]
+    lower = np.fmin(np.fmin.reduce(body, axis=1), boundary)
+    upper = np.fmax(np.fmax.reduce(body, axis=1), boundary)
+    return lower, upper
+
+def _pairwise(v, func):
+    """Reduce consecutive pairs of *v* with *func* (e.g. ``np.fmin``)."""
+    if len(v) % 2:
+        v = np.append(v, np.nan)
+    return func(v[0::2], v[1::2])
+
+def _segment_hits(segments, radius, x, y):
+    """
+    Mirror ``matplotlib.lines.segment_hits`` for an Nx4 array of display-space
+    segments: vertices within the radius are hits, as are segments whose
+    nearest point to the mouse lies inside the segment (as long as neither
+    endpoint was a hit). Returns boolean arrays of start, end, and line hits.
+    """
+    x0, y0, x1, y1 = segments.T
+    start_hits = np.hypot(x0 - x, y0 - y) <= radius
+    end_hits = np.hypot(x1 - x, y1 - y) <= radius
+    _, _, _, dist = pick_info._project_to_segments(x0, y0, x1, y1, x, y)
+    line_hits = (dist <= radius) & ~(start_hits | end_hits)
+    return start_hits, end_hits, line_hits
+
+def _hit_indices(start, end, start_hits, end_hits, line_hits):
+    """Combine the output of ``_segment_hits`` into an "ind" array of the
+    vertices that were hit followed by the segments that were hit."""
+    points = np.union1d(start[start_hits], end[end_hits])
+    lines = np.unique(start[line_hits])
+    return np.concatenate([points, lines]).astype(int)
+
+def _artist_state(artist):
+    """Things specific to *artist* that would require a rebuild if changed."""
+    if isinstance(artist, Line2D):
+        return (artist.get_xydata(), artist.get_drawstyle(),
+                artist.get_linestyle(), artist.get_transform())
+    else:
+        # ``set_sizes`` always stores a new array, so (like the offsets) the
+        # sizes can be compared by identity.
+        return (artist.get_offsets(), artist.get_sizes(),
+                artist.get_offset_transform())
+
+def _same_state(state1, state2):
+    """Compare two states from ``_artist_state``. Arrays are compared by
+    identity, as comparing their values would defeat the point."""
+    for item1, item2 in zip(state1, state2):
+        if isinstance(item1, np.ndarray) or isinstance(item2, np.ndarray):
+            if item1 is not item2:
+                return False
+        elif item1 != item2:
+            return False
+    return True
+
+def _artist_segments(artist, tolerance):
+    """
+    Returns an Nx4 array of display-space (x0, y0, x1, y1) segments for
+    *artist*, the pick radius (in pixels) of each segment, the indices of the
+    vertices at the start and end of each segment, and the number of drawn
+    vertices per data point (2 for step-style lines). Points (e.g. markers)
+    are represented as zero-length segments that start and end at the same
+    vertex.
+    """
+    if isinstance(artist, Line2D):
+        # Line2D's pick radius is in points, as with ``Line2D.contains``
+        pixels = tolerance * artist.figure.dpi / 72.0
+        geometry = pick_info._line_geometry(artist)
+        divisor = 1
+        linestyle = artist.get_linestyle()
+        if (linestyle in ['none', ' ', '', None, 'None']
+                or len(geometry['points']) < 2):
+            xy = geometry['points']
+            segments = np.hstack([xy, xy])
+            start = end = np.arange(len(xy))
+        else:
+            xy = geometry['screen']
+            segments = np.hstack([xy[:-1], xy[1:]])
+            start = np.arange(len(segments))
+            end = start + 1
+            divisor = geometry['step']
+        radius = np.full(len(segments), pixels)
+    else:
+        # ...while collections use pixels directly.
+        offsets = np.asarray(artist.get_offsets(), dtype=float)
+        xy = artist.get_offset_transform().transform(offsets)
+        segments = np.hstack([xy, xy])
+        start = end = np.arange(len(segments))
+        # Treat scatter markers as circles with a diameter of sqrt(s) points
+        sizes = np.ravel(artist.get_sizes())
+        if not sizes.size:
+            sizes = np.zeros(1)
+        marker_radius = np.sqrt(sizes) / 2 * artist.figure.dpi / 72.0
+        radius = tolerance + np.resize(marker_radius, len(segments))
+        divisor = 1
+    return segments, radius, start, end, divisor
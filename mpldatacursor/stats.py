@@ -0,0 +1,134 @@
+__license__ = """
+Copyright (c) 2012 mpldatacursor developers
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+import collections
+import time
+
+import numpy as np
+
+# time.perf_counter doesn't exist in python 2.
+timer = getattr(time, 'perf_counter', time.time)
+
+class LatencyStats(object):
+    """
+    Records how long each stage of handling a mouse event takes for a
+    DataCursor (see the ``stats`` kwarg to ``DataCursor``).
+
+    The stages recorded by DataCursor are:
+        `total`: All of the handling of a click or (coalesced) hover event.
+        `hit_test`: Finding the artist under the mouse.
+        `event_info`: Getting information about the pick (``pick_info``).
+        `props_override`: The user's ``props_override`` function, if any.
+        `formatter`: The formatter function.
+        `keep_inside`: Keeping the annotation box inside the figure.
+        `redraw`: Redrawing (or blitting) the figure.
+
+    Along with these, the following events are counted in ``counters``:
+        `motion_events`: Mouse motion events received in hover mode.
+        `motion_skipped`: Motion events ignored (see ``hover_threshold``).
+        `picks`: Mouse events that selected an artist.
+
+    Only the most recent *window* timings of each stage are kept, so the
+    percentiles are rolling. They're only computed when asked for, so
+    recording a timing is cheap.
+    """
+    def __init__(self, window=1000, callback=None):
+        """
+        Parameters
+        -----------
+        window : int, optional
+            The number of recent timings of each stage to keep for the
+            percentiles. Defaults to 1000.
+        callback : function, optional
+            If specified, this is called with the stage name and duration (in
+            seconds) of every timing as it's recorded. Defaults to None.
+        """
+        self.window = window
+        self.callback = callback
+        self.reset()
+
+    def reset(self):
+        """Discard all timings and counts."""
+        self._samples = {}
+        self._counts = collections.defaultdict(int)
+        self._totals = collections.defaultdict(float)
+        self.counters = collections.defaultdict(int)
+
+    def record(self, stage, seconds):
+        """Record that *stage* took *seconds*."""
+        samples = self._samples.get(stage)
+        if samples is None:
+            samples = collections.deque(maxlen=self.window)
+            self._samples[stage] = samples
+        samples.append(seconds)
+        self._counts[stage] += 1
+        self._totals[stage] += seconds
+        if self.callback is not None:
+            self.callback(stage, seconds)
+
+    def increment(self, name, count=1):
+        """Add *count* to the counter *name*."""
+        self.counters[name] += count
+
+    @property
+    def stages(self):
+        """The names of the stages that have been recorded."""
+        return sorted(self._samples)
+
+    def percentiles(self, stage, q=(50, 95, 99)):
+        """
+        The rolling percentiles *q* (in seconds) of the timings of *stage*.
+        Returns NaNs if *stage* hasn't been recorded.
+        """
+        samples = self._samples.get(stage)
+        if not samples:
+            return np.full(len(q), np.nan)
+        return np.percentile(list(samples), q)
+
+    def summary(self):
+        """
+        Summarize the timings of each stage.
+
+        Returns
+        --------
+        summary : dict
+            A dict of dicts with the keys "count" (the number of timings
+            recorded), "total" and "mean" (over all timings) and "p50",
+            "p95", "p99" and "max" (over the rolling window), keyed by stage.
+            All times are in seconds.
+        """
+        output = {}
+        for stage in self.stages:
+            count = self._counts[stage]
+            p50, p95, p99 = self.percentiles(stage)
+            output[stage] = dict(count=count, total=self._totals[stage],
+                                 mean=self._totals[stage] / count,
+                                 p50=p50, p95=p95, p99=p99,
+                                 max=max(self._samples[stage]))
+        return output
+
+    def __repr__(self):
+        lines = ['{}('.format(type(self).__name__)]
+        for stage, info in sorted(self.summary().items()):
+            lines.append('  {:<15s} n={count:<7d} p50={p50:.2e}s '
+                         'p95={p95:.2e}s p99={p99:.2e}s'.format(stage, **info))
+        lines.append(')')
+        return '\n'.join(lines)
@@ -0,0 +1,117 @@
+__license__ = """
+Copyright (c) 2012 mpldatacursor developers
+
+Permission is hereby granted, free of charge, to any person obtaining a copy of
+this software and associated documentation files (the "Software"), to deal in
+the Software without restriction, including without limitation the rights to
+use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies
+of the Software, and to permit persons to whom the Software is furnished to do
+so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+"""
+Measures the extent of text from its font properties alone, without drawing
+it. This works with any backend (including ones without a usable renderer,
+such as NbAgg and macosx), and the measurements are cached.
+"""
+import collections
+
+from matplotlib import cbook
+from matplotlib.textpath import TextToPath
+
+_text_to_path = TextToPath()
+
+# Measurements of recently used lines of text, most recent last.
+_cache = collections.OrderedDict()
+cache_size = 512
+
+def _line_metrics(line, prop, math):
+    """The (width, height, descent) of a single line of text in points."""
+    key = line, hash(prop), math
+    try:
+        metrics = _cache.pop(key)
+    except KeyError:
+        ismath = math and cbook.is_math_text(line)
+        if not ismath:
+            line = line.replace(r'\$', '$')
+        metrics = _text_to_path.get_text_width_height_descent(line, prop,
+                                                              ismath)
+        while len(_cache) >= cache_size:
+            _cache.popitem(last=False)
+    _cache[key] = metrics
+    return metrics
+
+def text_size(text, prop, dpi, linespacing=1.2, math=True):
+    """
+    The size of a (possibly multi-line) string of text as ``Text`` would
+    lay it out.
+
+    Parameters
+    -----------
+    text : string
+        The text to measure.
+    prop : a matplotlib FontProperties instance
+        The font properties of the text.
+    dpi : number
+        The dots-per-inch of the figure the text is drawn in.
+    linespacing : number, optional
+        The line spacing of multi-line text, as a multiple of the font size.
+        Defaults to 1.2 (the ``Text`` default).
+    math : boolean, optional
+        Whether or not text between dollar signs is treated as mathtext.
+        Defaults to True.
+
+    Returns
+    --------
+    width, height, descent : numbers
+        The width and height of the text and the descent of its last line
+        below the baseline, in pixels.
+    """
+    scale = dpi / 72.0
+    _, lp_h, lp_d = _line_metrics('lp', prop, False)
+    min_dy = (lp_h - lp_d) * linespacing
+
+    width, y = 0, 0
+    for i, line in enumerate(text.split('\n')):
+        if line:
+            w, h, d = _line_metrics(line, prop, math)
+        else:
+            w = h = d = 0
+        h, d = max(h, lp_h), max(d, lp_d)
+        width = max(width, w)
+        if i == 0:
+            y = -(h - d)
+        else:
+            y -= max(min_dy, (h - d) * linespacing)
+        y -= d
+    return scale * width, -scale * y, scale * d
+
+def text_extent(text, prop, dpi, x, y, ha='left', va='bottom',
+                linespacing=1.2, math=True):
+    """
+    The display extent (x0, y0, x1, y1) of unrotated text positioned at the
+    display coordinates *x*, *y* with the alignment *ha* and *va*. The other
+    parameters are the same as ``text_size``.
+    """
+    width, height, descent = text_size(text, prop, dpi, linespacing, math)
+    x0 = {'left':x, 'center':x - width / 2.0, 'right':x - width}[ha]
+    if va == 'top':
+        y0 = y - height
+    elif va == 'center':
+        y0 = y - height / 2.0
+    elif va in ('baseline', 'center_baseline'):
+        # This is only exact for a single line of text.
+        y0 = y - descent
+    else:
+        y0 = y
+    return x0, y0, x0 + width, y0 + height